@@ -6,6 +6,7 @@ import asyncio
 import json
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks, File, Header, HTTPException, UploadFile, WebSocket, WebSocketDisconnect
@@ -180,7 +181,7 @@ async def analysis_status(job_id: str):
         errors=state.errors,
         report_id=state.report_id,
         filename=state.filename,
-        stage_times=state.stage_times,
+        stage_times=state.stage_times_dict(),
     )
 
 
@@ -286,7 +287,9 @@ async def download_report_pdf(report_id: str):
 # ── Audit ────────────────────────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=1)
 def _get_audit_logger():
+    # One logger (and SQLite connection) shared by all audit endpoints
     from src.audit.audit_logger import AuditLogger
     return AuditLogger(settings.audit_db_path)
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import sqlite3
+import threading
+import uuid
+from collections.abc import Generator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -39,18 +42,136 @@ CREATE INDEX IF NOT EXISTS idx_audit_ts  ON audit_log(timestamp);
 CREATE INDEX IF NOT EXISTS idx_audit_user ON audit_log(user_id);
 """
 
+_INSERT_SQL = """\
+INSERT INTO audit_log (
+    audit_id, evaluation_id, doc_id, filename, dqc_version,
+    model_version, embedding_model, prompt_version,
+    total_tokens, score, passed, failed, partial,
+    processing_time, user_id, result_json, timestamp
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _row_from_report(report: ComplianceReport, doc_id: str, user: str) -> tuple:
+    """Build an `audit_log` row in `_INSERT_SQL` column order."""
+    audit = report.audit
+    summary = report.overall_compliance
+    return (
+        uuid.uuid4().hex,
+        report.report_id,
+        doc_id,
+        report.document.filename,
+        report.dqc_version,
+        audit.model_version,
+        audit.embedding_model,
+        audit.prompt_version,
+        audit.total_tokens_used,
+        summary.score,
+        summary.passed,
+        summary.failed,
+        summary.partial,
+        audit.processing_time_seconds,
+        user,
+        report.model_dump_json(),
+        datetime.utcnow().isoformat(),
+    )
+
+
+# Memory-map up to 256 MiB of the DB file for reads
+_MMAP_SIZE = 256 * 1024 * 1024
+
 
 class AuditLogger:
     """SQLite-based audit logger for compliance evaluations."""
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(self, db_path: str | Path, conn: sqlite3.Connection | None = None) -> None:
+        """Open (and initialise) the audit DB at `db_path`.
+
+        One connection is kept for the logger's lifetime. If `conn` is given it
+        is used instead (and left open by `close`), so callers can share it.
+        `db_path` may also be ``":memory:"`` or a ``file:`` URI.
+        """
         self._db_path = str(db_path)
-        Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+        is_uri = self._db_path.startswith("file:")
+        if not is_uri and self._db_path != ":memory:":
+            Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._owns_conn = conn is None
+        if conn is None:
+            # Autocommit mode: transactions are opened explicitly in _write()
+            conn = sqlite3.connect(
+                self._db_path, isolation_level=None, check_same_thread=False, uri=is_uri
+            )
+        self._conn = conn
+        # The API serves requests from several threads through one logger
+        self._lock = threading.RLock()
+        self._configure(conn)
         self._init_db()
 
+    @staticmethod
+    def _configure(conn: sqlite3.Connection) -> None:
+        # WAL (set persistently in _init_db) only needs fsync at checkpoints
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+
+    def close(self) -> None:
+        """Close the connection, unless it was injected by the caller."""
+        if self._owns_conn and self._conn is not None:
+            self._conn.close()
+        self._conn = None
+
+    def __del__(self) -> None:
+        # __init__ may have failed before the connection existed
+        if getattr(self, "_conn", None) is not None:
+            self.close()
+
+    @contextmanager
+    def _write(self) -> Generator[sqlite3.Connection, None, None]:
+        """A write transaction; nested as a savepoint if one is already open."""
+        with self._lock:
+            conn = self._conn
+            if conn.in_transaction:
+                conn.execute("SAVEPOINT audit_write")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK TO audit_write")
+                    raise
+                finally:
+                    conn.execute("RELEASE audit_write")
+            else:
+                # One write lock and one commit for the whole block
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+
+    @contextmanager
+    def savepoint(self) -> Generator[None, None, None]:
+        """Roll back everything written inside the block when it exits.
+
+        Used to isolate tests that share one DB.
+        """
+        self._conn.execute("SAVEPOINT audit_outer")
+        try:
+            yield
+        finally:
+            self._conn.execute("ROLLBACK TO audit_outer")
+            self._conn.execute("RELEASE audit_outer")
+
+    def _query(self, sql: str, params: tuple = ()) -> list[dict[str, Any]]:
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.row_factory = sqlite3.Row
+            return [dict(r) for r in cur.execute(sql, params).fetchall()]
+
     def _init_db(self) -> None:
-        with sqlite3.connect(self._db_path) as conn:
-            conn.executescript(_CREATE_TABLE)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_CREATE_TABLE)
         logger.debug("Audit DB initialised", path=self._db_path)
 
     def log_evaluation(
@@ -60,66 +181,31 @@ class AuditLogger:
         user: str,
     ) -> None:
         """Write a full audit record for a completed evaluation."""
-        import uuid
-
-        audit_id = uuid.uuid4().hex
-        result_json = report.model_dump_json()
-
-        with sqlite3.connect(self._db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO audit_log (
-                    audit_id, evaluation_id, doc_id, filename, dqc_version,
-                    model_version, embedding_model, prompt_version,
-                    total_tokens, score, passed, failed, partial,
-                    processing_time, user_id, result_json, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    audit_id,
-                    report.report_id,
-                    doc_id,
-                    report.document.filename,
-                    report.dqc_version,
-                    report.audit.model_version,
-                    report.audit.embedding_model,
-                    report.audit.prompt_version,
-                    report.audit.total_tokens_used,
-                    report.overall_compliance.score,
-                    report.overall_compliance.passed,
-                    report.overall_compliance.failed,
-                    report.overall_compliance.partial,
-                    report.audit.processing_time_seconds,
-                    user,
-                    result_json,
-                    datetime.utcnow().isoformat(),
-                ),
-            )
-        logger.info("Audit record saved", audit_id=audit_id, doc_id=doc_id)
+        self.log_evaluations_bulk([(report, doc_id, user)])
+
+    def log_evaluations_bulk(self, items: list[tuple[ComplianceReport, str, str]]) -> None:
+        """Write audit records for many ``(report, doc_id, user)`` items in one transaction."""
+        if not items:
+            return
+
+        rows = [_row_from_report(report, doc_id, user) for report, doc_id, user in items]
+        with self._write() as conn:
+            conn.executemany(_INSERT_SQL, rows)
+        for audit_id, _, doc_id, *_ in rows:
+            logger.info("Audit record saved", audit_id=audit_id, doc_id=doc_id)
 
     def query_by_doc(self, doc_id: str) -> list[dict[str, Any]]:
         """Retrieve audit records for a specific document."""
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                "SELECT * FROM audit_log WHERE doc_id = ? ORDER BY timestamp DESC", (doc_id,)
-            ).fetchall()
-        return [dict(r) for r in rows]
+        return self._query(
+            "SELECT * FROM audit_log WHERE doc_id = ? ORDER BY timestamp DESC", (doc_id,)
+        )
 
     def query_recent(self, limit: int = 20) -> list[dict[str, Any]]:
         """Retrieve the most recent audit records."""
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                "SELECT * FROM audit_log ORDER BY timestamp DESC LIMIT ?", (limit,)
-            ).fetchall()
-        return [dict(r) for r in rows]
+        return self._query("SELECT * FROM audit_log ORDER BY timestamp DESC LIMIT ?", (limit,))
 
     def query_by_user(self, user_id: str) -> list[dict[str, Any]]:
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                "SELECT * FROM audit_log WHERE user_id = ? ORDER BY timestamp DESC",
-                (user_id,),
-            ).fetchall()
-        return [dict(r) for r in rows]
+        return self._query(
+            "SELECT * FROM audit_log WHERE user_id = ? ORDER BY timestamp DESC",
+            (user_id,),
+        )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -44,6 +45,8 @@ class Settings(BaseSettings):
     # ── Vector DB ────────────────────────────────────────────────
     chroma_persist_dir: str = str(_BASE_DIR / "data" / "vectordb")
     chroma_collection_name: str = "lra_documents"
+    # One collection per document: searches skip the doc_id metadata filter
+    chroma_collection_per_doc: bool = False
 
     # ── Evaluation Mode ──────────────────────────────────────────
     # auto = long-context if doc fits, else RAG
@@ -55,10 +58,17 @@ class Settings(BaseSettings):
     # ── Retrieval ────────────────────────────────────────────────
     retrieval_top_k: int = 10
     retrieval_score_threshold: float = 0.5
+    # Keep batched-retrieval chunk vectors as int8 (per-dimension scale): 4x less memory
+    retrieval_quantize_int8: bool = False
 
     # ── Chunking ─────────────────────────────────────────────────
     chunk_size: int = 1000
     chunk_overlap: int = 150
+    # token = encode each section once and slice fixed token windows
+    # sentence = pack whole sentences (slower, keeps sentence boundaries)
+    chunk_strategy: Literal["token", "sentence"] = "token"
+    # tiktoken = cl100k_base (default); huggingface = Rust `tokenizers` BPE
+    tokenizer_backend: Literal["tiktoken", "huggingface"] = "tiktoken"
 
     # ── Paths ────────────────────────────────────────────────────
     upload_dir: str = str(_BASE_DIR / "data" / "uploads")
@@ -83,6 +93,7 @@ class Settings(BaseSettings):
             Path(d).mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Return a cached Settings instance."""
     return Settings()
@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 import re
 import time
+from bisect import bisect_right
 from pathlib import Path
 
+import orjson
 from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import StrOutputParser
 
@@ -37,25 +39,28 @@ logger = get_logger(__name__)
 
 PROMPT_VERSION = "v1.0"
 
+# A comma followed only by whitespace before a closing brace/bracket
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+# Confidence band edges: < 0.5, [0.5, 0.8), >= 0.8
+_CONFIDENCE_BANDS = (0.5, 0.8)
+
+# Scoring matrix: status → risk level per confidence band (low, medium, high)
+_RISK_MATRIX: dict[DQCStatus, tuple[RiskLevel, RiskLevel, RiskLevel]] = {
+    DQCStatus.FAIL: (RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL),
+    DQCStatus.PARTIAL: (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH),
+    DQCStatus.PASS: (RiskLevel.LOW, RiskLevel.LOW, RiskLevel.LOW),
+}
+
 
 def _risk_level(status: DQCStatus, confidence: float) -> RiskLevel:
     """Compute risk level from the scoring matrix."""
-    if status == DQCStatus.FAIL:
-        if confidence >= 0.8:
-            return RiskLevel.CRITICAL
-        if confidence >= 0.5:
-            return RiskLevel.HIGH
-        return RiskLevel.MEDIUM
-    if status == DQCStatus.PARTIAL:
-        if confidence >= 0.8:
-            return RiskLevel.HIGH
-        if confidence >= 0.5:
-            return RiskLevel.MEDIUM
-        return RiskLevel.LOW
-    # Pass
-    if confidence < 0.5:
-        return RiskLevel.LOW
-    return RiskLevel.LOW
+    return _RISK_MATRIX[status][bisect_right(_CONFIDENCE_BANDS, confidence)]
+
+
+def _requirement_query(item: DQCItem) -> str:
+    """Retrieval query text for a DQC item."""
+    return f"{item.requirement}. {item.criteria}"
 
 
 class DQCEngine:
@@ -87,13 +92,18 @@ class DQCEngine:
         self,
         item: DQCItem,
         doc_id: str,
+        retrieval: RetrievalResult | None = None,
     ) -> DQCEvaluationResult:
-        """Evaluate a single DQC item against the document."""
+        """Evaluate a single DQC item against the document.
+
+        `retrieval` may be supplied when context was already fetched in a batch.
+        """
         # 1. Retrieve relevant context
-        retrieval: RetrievalResult = self._retrieval.retrieve_for_dqc_item(
-            requirement_text=f"{item.requirement}. {item.criteria}",
-            doc_id=doc_id,
-        )
+        if retrieval is None:
+            retrieval = self._retrieval.retrieve_for_dqc_item(
+                requirement_text=_requirement_query(item),
+                doc_id=doc_id,
+            )
 
         if not retrieval.chunks:
             logger.warning("No chunks retrieved", item_id=item.item_id)
@@ -174,9 +184,15 @@ class DQCEngine:
         )
         self._token_tracker.reset()
 
+        # Score every item's query against the document's vectors in one pass
+        retrievals = self._retrieval.retrieve_batch(
+            [_requirement_query(item) for item in checklist.items],
+            doc_id=doc_id,
+        )
+
         findings: list[DQCEvaluationResult] = []
-        for item in checklist.items:
-            result = self.evaluate_item(item, doc_id)
+        for item, retrieval in zip(checklist.items, retrievals):
+            result = self.evaluate_item(item, doc_id, retrieval=retrieval)
             findings.append(result)
 
         # Aggregate
@@ -397,7 +413,8 @@ class DQCEngine:
     def _repair_json(text: str) -> str:
         """Fix common LLM JSON mistakes: trailing commas, unescaped newlines."""
         # Remove trailing commas before } or ]
-        text = re.sub(r",\s*([}\]])", r"\1", text)
+        if "," in text:
+            text = _TRAILING_COMMA_RE.sub(r"\1", text)
         # Replace literal newlines inside strings (crude but effective)
         # We do NOT touch \n that are already escaped
         return text
@@ -405,7 +422,7 @@ class DQCEngine:
     def _try_parse_json(self, raw_response: str) -> dict | None:
         """Multi-layer JSON parsing with progressive repair.
 
-        Layer 1: Direct json.loads (works when structured LLM is used)
+        Layer 1: Direct orjson.loads (works when structured LLM is used)
         Layer 2: Strip markdown fences
         Layer 3: Extract first { ... } block via bracket matching
         Layer 4: Regex repair (trailing commas, etc.) on extracted block
@@ -422,11 +439,11 @@ class DQCEngine:
 
         for label, text in attempts:
             try:
-                data = json.loads(text)
+                data = orjson.loads(text)
                 if isinstance(data, dict) and "evaluations" in data:
                     logger.info("JSON parsed successfully", method=label)
                     return data
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 continue
 
         return None
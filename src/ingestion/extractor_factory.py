@@ -34,11 +34,9 @@ _EXTRACTOR_MAP = {
 
 def _file_hash(file_path: Path) -> str:
     """Compute SHA-256 hash of a file."""
-    sha = hashlib.sha256()
+    # Streams through one reused buffer (readinto), never the whole file in memory
     with open(file_path, "rb") as f:
-        for block in iter(lambda: f.read(8192), b""):
-            sha.update(block)
-    return sha.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def detect_format(file_path: str | Path) -> DocumentFormat:
@@ -3,10 +3,29 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+
+@dataclass(slots=True, frozen=True)
+class ChunkMeta:
+    """Per-document source fields carried by every chunk.
+
+    Frozen so one instance can be shared by all chunks of a document. Any
+    other keys (extractor- or caller-supplied) are kept in ``extra`` and
+    flattened into the vector-store metadata alongside the typed fields.
+    """
+
+    filename: str = ""
+    format: str = ""
+    extra: Mapping[str, Any] = field(default_factory=dict)
+
+
+_CHUNK_META_FIELDS = frozenset(f.name for f in fields(ChunkMeta))
 
 
 class Chunk(BaseModel):
@@ -21,7 +40,19 @@ class Chunk(BaseModel):
     chunk_index: int = 0
     token_count: int = 0
     upload_timestamp: datetime = Field(default_factory=datetime.utcnow)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: ChunkMeta = Field(default_factory=ChunkMeta)
+
+    @field_validator("metadata", mode="before")
+    @classmethod
+    def _collect_extra_metadata(cls, value: Any) -> Any:
+        """Move keys of a plain metadata dict that ChunkMeta doesn't type into ``extra``."""
+        if not isinstance(value, Mapping):
+            return value
+        extra = {k: v for k, v in value.items() if k not in _CHUNK_META_FIELDS}
+        if not extra:
+            return value
+        known = {k: v for k, v in value.items() if k in _CHUNK_META_FIELDS}
+        return {**known, "extra": {**known.get("extra", {}), **extra}}
 
     def to_vectorstore_metadata(self) -> dict[str, Any]:
         """Flatten metadata for ChromaDB storage."""
@@ -33,5 +64,7 @@ class Chunk(BaseModel):
             "chunk_index": self.chunk_index,
             "token_count": self.token_count,
             "upload_timestamp": self.upload_timestamp.isoformat(),
-            **self.metadata,
+            "filename": self.metadata.filename,
+            "format": self.metadata.format,
+            **self.metadata.extra,
         }
@@ -21,7 +21,7 @@ from src.preprocessing.chunker import chunk_document
 from src.reporting.json_reporter import save_json_report
 from src.reporting.pdf_reporter import generate_pdf_report
 from src.retrieval.retriever import RetrievalEngine
-from src.vectorstore.chroma_store import VectorStore
+from src.vectorstore.chroma_store import VectorStore, get_vector_store
 from src.audit.audit_logger import AuditLogger
 
 logger = get_logger(__name__)
@@ -50,9 +50,13 @@ class PipelineState(BaseModel):
     stage: PipelineStage = PipelineStage.PENDING
     progress: float = 0.0  # 0–100
     errors: list[str] = Field(default_factory=list)
-    stage_times: dict[str, float] = Field(default_factory=dict)
+    stage_times: list[tuple[PipelineStage, float]] = Field(default_factory=list)
     report_id: str | None = None
 
+    def stage_times_dict(self) -> dict[str, float]:
+        """Serialize recorded stage timings as ``{stage: seconds}``."""
+        return {stage.value: elapsed for stage, elapsed in self.stage_times}
+
 
 class Pipeline:
     """Full orchestration pipeline — wires all components together."""
@@ -65,7 +69,9 @@ class Pipeline:
     ) -> None:
         self._settings = settings or get_settings()
 
-        # BYOK: override the Google API key if the user provided one
+        # BYOK: override the Google API key if the user provided one.
+        # get_settings() is shared process-wide, so never mutate it in place;
+        # model_copy is a shallow __dict__ copy (update values are not re-validated).
         if google_api_key_override:
             self._settings = self._settings.model_copy(
                 update={"google_api_key": google_api_key_override}
@@ -82,14 +88,22 @@ class Pipeline:
         self._audit = AuditLogger(self._settings.audit_db_path)
 
     def _emit(self, stage: PipelineStage, progress: float) -> None:
+        if self._on_progress is None:
+            # Headless run: nobody observes the state mid-flight, so skip
+            # BaseModel.__setattr__ and write the fields directly.
+            self.state.__dict__.update(stage=stage, progress=progress)
+            return
         self.state.stage = stage
         self.state.progress = progress
-        if self._on_progress:
-            self._on_progress(self.state)
+        self._on_progress(self.state)
 
     def _init_components(self, need_vectorstore: bool = True) -> None:
         if need_vectorstore and self._vector_store is None:
-            self._vector_store = VectorStore(self._settings)
+            # Reuse the shared store unless this run has its own settings (e.g. BYOK key)
+            if self._settings is get_settings():
+                self._vector_store = get_vector_store()
+            else:
+                self._vector_store = VectorStore(self._settings)
             self._retrieval_engine = RetrievalEngine(self._vector_store)
         if self._dqc_engine is None:
             self._dqc_engine = DQCEngine(self._retrieval_engine, self._settings)
@@ -132,7 +146,7 @@ class Pipeline:
         Returns:
             ComplianceReport with all findings and metadata.
         """
-        pipeline_start = time.time()
+        pipeline_start = time.perf_counter()
 
         file_path = Path(file_path)
         if dqc_path is None:
@@ -144,10 +158,10 @@ class Pipeline:
         try:
             # ── Stage 1: Ingestion ───────────────────────────────
             self._emit(PipelineStage.INGESTION, 5)
-            t0 = time.time()
+            t0 = time.perf_counter()
             content: ExtractedContent = extract_document(file_path)
             self.state.doc_id = content.doc_id
-            self.state.stage_times["ingestion"] = time.time() - t0
+            self.state.stage_times.append((PipelineStage.INGESTION, time.perf_counter() - t0))
 
             if not content.is_valid:
                 raise ValueError(
@@ -165,15 +179,15 @@ class Pipeline:
 
             # ── Reporting (common) ───────────────────────────────
             self._emit(PipelineStage.REPORTING, 90)
-            t0 = time.time()
+            t0 = time.perf_counter()
 
-            report.audit.processing_time_seconds = round(time.time() - pipeline_start, 2)
+            report.audit.processing_time_seconds = round(time.perf_counter() - pipeline_start, 2)
             report.audit.user = user
 
             json_path = save_json_report(report, self._settings.report_dir)
             pdf_path = generate_pdf_report(report, self._settings.report_dir)
 
-            self.state.stage_times["reporting"] = time.time() - t0
+            self.state.stage_times.append((PipelineStage.REPORTING, time.perf_counter() - t0))
             self.state.report_id = report.report_id
 
             # ── Audit log ────────────────────────────────────────
@@ -213,7 +227,7 @@ class Pipeline:
 
         # Skip straight to evaluation
         self._emit(PipelineStage.EVALUATION, 20)
-        t0 = time.time()
+        t0 = time.perf_counter()
         checklist: DQCChecklist = load_dqc_checklist(dqc_path)
         doc_info = DocumentInfo(
             id=content.doc_id,
@@ -226,7 +240,7 @@ class Pipeline:
             document_text=content.raw_text,
             doc_info=doc_info,
         )
-        self.state.stage_times["evaluation"] = time.time() - t0
+        self.state.stage_times.append((PipelineStage.EVALUATION, time.perf_counter() - t0))
         self._emit(PipelineStage.EVALUATION, 85)
         return report
 
@@ -248,9 +262,9 @@ class Pipeline:
 
         # ── Stage 2: Preprocessing ───────────────────────────────
         self._emit(PipelineStage.PREPROCESSING, 18)
-        t0 = time.time()
+        t0 = time.perf_counter()
         chunks = chunk_document(content)
-        self.state.stage_times["preprocessing"] = time.time() - t0
+        self.state.stage_times.append((PipelineStage.PREPROCESSING, time.perf_counter() - t0))
         self._emit(PipelineStage.PREPROCESSING, 25)
 
         if not chunks:
@@ -258,15 +272,16 @@ class Pipeline:
 
         # ── Stage 3: Embedding ───────────────────────────────────
         self._emit(PipelineStage.EMBEDDING, 28)
-        t0 = time.time()
+        t0 = time.perf_counter()
         self._vector_store.delete_by_doc_id(content.doc_id)
         self._vector_store.add_chunks(chunks)
-        self.state.stage_times["embedding"] = time.time() - t0
+        self._retrieval_engine.invalidate(content.doc_id)
+        self.state.stage_times.append((PipelineStage.EMBEDDING, time.perf_counter() - t0))
         self._emit(PipelineStage.EMBEDDING, 40)
 
         # ── Stage 4: Evaluation ──────────────────────────────────
         self._emit(PipelineStage.EVALUATION, 42)
-        t0 = time.time()
+        t0 = time.perf_counter()
         checklist: DQCChecklist = load_dqc_checklist(dqc_path)
         doc_info = DocumentInfo(
             id=content.doc_id,
@@ -279,6 +294,6 @@ class Pipeline:
             doc_id=content.doc_id,
             doc_info=doc_info,
         )
-        self.state.stage_times["evaluation"] = time.time() - t0
+        self.state.stage_times.append((PipelineStage.EVALUATION, time.perf_counter() - t0))
         self._emit(PipelineStage.EVALUATION, 85)
         return report
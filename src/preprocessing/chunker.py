@@ -2,21 +2,165 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, repeat
+from typing import Any
+
 import tiktoken
 
 from src.config import get_settings
 from src.logger import get_logger
-from src.models.chunk import Chunk
+from src.models.chunk import Chunk, ChunkMeta
 from src.models.document import ExtractedContent, Section
 
 logger = get_logger(__name__)
 
-# Use cl100k_base tokenizer (close to Gemini tokenizer for counting purposes)
-_ENCODER = tiktoken.get_encoding("cl100k_base")
+# cl100k-equivalent BPE on the HuggingFace hub, used by the "huggingface" backend
+_HF_TOKENIZER_NAME = "Xenova/gpt-4"
+
+
+def _gpt2_byte_decoder() -> dict[str, int]:
+    """Invert the GPT-2 byte-to-unicode alphabet used by byte-level BPE vocabularies."""
+    printable = [
+        *range(ord("!"), ord("~") + 1),
+        *range(ord("¡"), ord("¬") + 1),
+        *range(ord("®"), ord("ÿ") + 1),
+    ]
+    decoder = {chr(b): b for b in printable}
+    shifted = 256
+    for b in range(256):
+        if b not in decoder.values():
+            decoder[chr(shifted)] = b
+            shifted += 1
+    return decoder
+
+
+_BYTE_DECODER = _gpt2_byte_decoder()
+
+
+class _HFEncoder:
+    """Adapter exposing the subset of tiktoken's Encoding API the chunker uses."""
+
+    def __init__(self, tokenizer: Any) -> None:
+        self._tok = tokenizer
+
+    def encode_ordinary(self, text: str) -> list[int]:
+        return self._tok.encode(text, add_special_tokens=False).ids
+
+    def decode(self, ids: list[int]) -> str:
+        return self._tok.decode(ids)
+
+    def decode_single_token_bytes(self, token: int) -> bytes:
+        piece = self._tok.id_to_token(token)
+        try:
+            return bytes(_BYTE_DECODER[c] for c in piece)
+        except KeyError:
+            # Not a byte-level vocabulary: tokens are whole characters
+            return piece.encode("utf-8")
+
+
+def _load_encoder(backend: str) -> Any:
+    """Return the token encoder for the configured backend (tiktoken fallback)."""
+    if backend == "huggingface":
+        try:
+            from tokenizers import Tokenizer
+
+            return _HFEncoder(Tokenizer.from_pretrained(_HF_TOKENIZER_NAME))
+        except Exception as exc:
+            logger.warning(
+                "HuggingFace tokenizer unavailable, falling back to tiktoken",
+                tokenizer=_HF_TOKENIZER_NAME,
+                error=str(exc),
+            )
+    # Use cl100k_base tokenizer (close to Gemini tokenizer for counting purposes)
+    return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=1)
+def _get_encoder() -> Any:
+    """The process-wide encoder, loaded on first use (also in spawned workers)."""
+    return _load_encoder(get_settings().tokenizer_backend)
+
+
+# Paragraph breaks or whitespace after sentence-ending punctuation, in one pass
+_SPLIT_RE = re.compile(r"\n\s*\n|(?<=[.!?])\s+")
+
+# Below this much section text, worker start-up (spawn + tokenizer load)
+# costs more than it saves — tokenization runs at several MB/s per core.
+_PARALLEL_MIN_CHARS = 2_000_000
+
+# Chunks with fewer tokens than this are dropped as noise
+_MIN_CHUNK_TOKENS = 20
 
 
 def _count_tokens(text: str) -> int:
-    return len(_ENCODER.encode(text))
+    return len(_get_encoder().encode_ordinary(text))
+
+
+def _count_tokens_batch(texts: list[str]) -> list[int]:
+    """Token counts for many strings, one encoder lookup for the whole list.
+
+    A plain loop beats tiktoken's ``encode_ordinary_batch``, which starts a new
+    thread pool per call (and would oversubscribe the chunking worker processes).
+    """
+    encode = _get_encoder().encode_ordinary
+    return [len(encode(t)) for t in texts]
+
+
+def _split_tokens(
+    text: str,
+    max_tokens: int,
+    overlap_tokens: int,
+) -> list[tuple[str, int]]:
+    """Encode once and slice the token ids into overlapping windows.
+
+    BPE tokens can split a multi-byte UTF-8 character, so every window edge is
+    moved back to the nearest character boundary (the window's end shrinks,
+    the next window's overlap grows). Only a single character spanning more
+    than `max_tokens` tokens can push a window past the limit.
+
+    Returns ``(chunk_text, token_count)`` pairs.
+    """
+    # Bind the hot callables once; the loop runs once per window
+    encoder = _get_encoder()
+    decode = encoder.decode
+    token_bytes = encoder.decode_single_token_bytes
+    ids = encoder.encode_ordinary(text)
+    n_ids = len(ids)
+
+    def on_char_edge(i: int) -> bool:
+        # The edge before ids[i] is clean unless that token opens with a continuation byte
+        return i >= n_ids or token_bytes(ids[i])[0] & 0xC0 != 0x80
+
+    windows: list[tuple[str, int]] = []
+    append = windows.append
+    start = 0
+    while start < n_ids:
+        end = min(start + max_tokens, n_ids)
+        cut = end
+        while cut > start and not on_char_edge(cut):
+            cut -= 1
+        if cut == start:
+            # One character is wider than the window: extend to its end instead
+            cut = end
+            while not on_char_edge(cut):
+                cut += 1
+        end = cut
+        append((decode(ids[start:end]), end - start))
+        if end >= n_ids:
+            break
+        nxt = max(end - overlap_tokens, start + 1)
+        while not on_char_edge(nxt):
+            nxt -= 1
+        start = nxt if nxt > start else end
+    return windows
 
 
 def _split_text(
@@ -26,98 +170,155 @@ def _split_text(
 ) -> list[str]:
     """Split text into chunks respecting sentence boundaries."""
     sentences = _sentence_split(text)
+    sent_toks = _count_tokens_batch(sentences)
     chunks: list[str] = []
+    emit = chunks.append
+    join = " ".join
+    # Parallel lists: sentences in the open chunk and their token counts
     current: list[str] = []
-    current_tokens = 0
-
-    for sentence in sentences:
-        sent_tokens = _count_tokens(sentence)
+    current_toks: list[int] = []
 
+    i = 0
+    n = len(sentences)
+    while i < n:
         # If a single sentence exceeds max, force-split by words
-        if sent_tokens > max_tokens:
+        if sent_toks[i] > max_tokens:
             if current:
-                chunks.append(" ".join(current))
-                current, current_tokens = _overlap_carry(current, overlap_tokens)
+                emit(join(current))
+                current, current_toks, _ = _overlap_carry(current, current_toks, overlap_tokens)
 
-            words = sentence.split()
+            words = sentences[i].split()
             word_buf: list[str] = []
+            word_toks: list[int] = []
             word_tok = 0
-            for w in words:
-                wt = _count_tokens(w)
+            for w, wt in zip(words, _count_tokens_batch(words)):
                 if word_tok + wt > max_tokens and word_buf:
-                    chunks.append(" ".join(word_buf))
-                    word_buf, word_tok = [], 0
+                    emit(join(word_buf))
+                    word_buf, word_toks, word_tok = [], [], 0
                 word_buf.append(w)
+                word_toks.append(wt)
                 word_tok += wt
             if word_buf:
                 current = word_buf
-                current_tokens = word_tok
+                current_toks = word_toks
+            i += 1
             continue
 
-        if current_tokens + sent_tokens > max_tokens and current:
-            chunks.append(" ".join(current))
-            current, current_tokens = _overlap_carry(current, overlap_tokens)
-
-        current.append(sentence)
-        current_tokens += sent_tokens
+        # Pack the run of sentences up to the next oversized one
+        j = i
+        while j < n and sent_toks[j] <= max_tokens:
+            j += 1
+        current, current_toks = _pack_run(
+            current + sentences[i:j],
+            current_toks + sent_toks[i:j],
+            len(current),
+            max_tokens,
+            overlap_tokens,
+            emit,
+        )
+        i = j
 
     if current:
-        chunks.append(" ".join(current))
+        emit(join(current))
 
     return chunks
 
 
+def _pack_run(
+    run: list[str],
+    run_toks: list[int],
+    taken: int,
+    max_tokens: int,
+    overlap_tokens: int,
+    emit: Callable[[str], None],
+) -> tuple[list[str], list[int]]:
+    """Greedily pack `run` into chunks, locating every split point by bisection.
+
+    The first `taken` items are the chunk already open. Each chunk ends at the
+    first sentence that would push it over `max_tokens` (a chunk always gains
+    at least one new sentence), and the next one starts at the longest tail
+    that fits in `overlap_tokens` — both found on the prefix sums of the
+    token counts instead of re-adding them sentence by sentence.
+    Returns the still-open chunk and its token counts.
+    """
+    cum = list(accumulate(run_toks, initial=0))
+    n = len(run)
+    start = 0
+    end = max(taken, 1) if n else 0
+    while end < n:
+        # First sentence at or after `end + 1` that no longer fits
+        stop = bisect_right(cum, cum[start] + max_tokens, end + 1) - 1
+        if stop >= n:
+            break
+        emit(" ".join(run[start:stop]))
+        start = bisect_left(cum, cum[stop] - overlap_tokens, start, stop)
+        end = stop + 1
+    return run[start:], run_toks[start:]
+
+
 def _sentence_split(text: str) -> list[str]:
     """Naive but effective sentence splitter (paragraph + period-based)."""
-    import re
-
-    # Split on paragraph boundaries first
-    paragraphs = re.split(r"\n\s*\n", text)
-    sentences: list[str] = []
-    for para in paragraphs:
-        para = para.strip()
-        if not para:
-            continue
-        # Split on sentence-ending punctuation
-        parts = re.split(r"(?<=[.!?])\s+", para)
-        sentences.extend(p.strip() for p in parts if p.strip())
-    return sentences
+    return [part for p in _SPLIT_RE.split(text) if (part := p.strip())]
 
 
 def _overlap_carry(
-    current: list[str], overlap_tokens: int
-) -> tuple[list[str], int]:
-    """Return the tail of `current` that fits within `overlap_tokens`."""
-    carry: list[str] = []
+    current: list[str], current_toks: list[int], overlap_tokens: int
+) -> tuple[list[str], list[int], int]:
+    """Return the tail of `current` (and its token counts) that fits within `overlap_tokens`.
+
+    Uses the counts already computed by `_split_text`; nothing is re-encoded.
+    """
+    # Walk back from the tail to find where the carry starts, then slice once
+    start = len(current)
     carry_tok = 0
-    for sent in reversed(current):
-        st = _count_tokens(sent)
-        if carry_tok + st > overlap_tokens:
-            break
-        carry.insert(0, sent)
-        carry_tok += st
-    return carry, carry_tok
+    while start > 0 and carry_tok + current_toks[start - 1] <= overlap_tokens:
+        start -= 1
+        carry_tok += current_toks[start]
+    return current[start:], current_toks[start:], carry_tok
 
 
-def _build_section_map(content: ExtractedContent) -> dict[int, str]:
-    """Map page numbers to the most recent section title."""
-    page_section: dict[int, str] = {}
-    current_section = "Untitled"
-    section_pages: list[tuple[int, str]] = []
+def _surely_too_small(text: str) -> bool:
+    """True if `text` must be under `_MIN_CHUNK_TOKENS` without encoding it.
 
-    for sec in content.sections:
-        if sec.page_start is not None:
-            section_pages.append((sec.page_start, sec.title))
+    Byte-level BPE tokens span at least one byte, so ASCII text never has more
+    tokens than characters. Non-ASCII text (CJK, accents) can, so it is not
+    prefiltered.
+    """
+    return len(text) < _MIN_CHUNK_TOKENS and text.isascii()
 
-    section_pages.sort(key=lambda x: x[0])
 
-    sec_idx = 0
-    for page in content.pages:
-        while sec_idx < len(section_pages) and section_pages[sec_idx][0] <= page.page_number:
-            current_section = section_pages[sec_idx][1]
-            sec_idx += 1
-        page_section[page.page_number] = current_section
+def _chunk_one_section(
+    text: str,
+    max_tokens: int,
+    overlap_tokens: int,
+    strategy: str,
+) -> list[tuple[str, int]]:
+    """Split one section into ``(chunk_text, token_count)`` pairs.
 
+    Module-level so it can be pickled to worker processes.
+    """
+    if strategy == "sentence":
+        return [
+            (t, _count_tokens(t))
+            for t in _split_text(text, max_tokens, overlap_tokens)
+            if not _surely_too_small(t)
+        ]
+    return _split_tokens(text, max_tokens, overlap_tokens)
+
+
+def _build_section_map(content: ExtractedContent) -> dict[int, str]:
+    """Map page numbers to the most recent section title."""
+    section_pages = sorted(
+        ((sec.page_start, sec.title) for sec in content.sections if sec.page_start is not None),
+        key=lambda x: x[0],
+    )
+    starts = [start for start, _ in section_pages]
+    titles = [title for _, title in section_pages]
+
+    page_section: dict[int, str] = {}
+    for page in content.pages:
+        i = bisect_right(starts, page.page_number) - 1
+        page_section[page.page_number] = titles[i] if i >= 0 else "Untitled"
     return page_section
 
 
@@ -126,34 +327,41 @@ def chunk_document(content: ExtractedContent) -> list[Chunk]:
 
     Strategy:
     1. Group text by section boundaries.
-    2. Split each section into chunks of ~chunk_size tokens with overlap.
+    2. Split each section into chunks of ~chunk_size tokens with overlap
+       (token windows by default, whole sentences if chunk_strategy="sentence").
     3. Tag each chunk with section name, page range, doc_id.
     """
     settings = get_settings()
     max_tokens = settings.chunk_size
     overlap_tokens = settings.chunk_overlap
+    strategy = settings.chunk_strategy
 
     logger.info(
         "Chunking document",
         doc_id=content.doc_id,
         max_tokens=max_tokens,
         overlap=overlap_tokens,
+        strategy=strategy,
     )
 
     # Build section text groups
     section_groups: list[tuple[str, str, int | None]] = []  # (section_name, text, page_start)
 
     if content.sections:
+        # Sort pages once so each section slices its page range via bisect
+        pages = sorted(content.pages, key=lambda p: p.page_number)
+        page_numbers = [p.page_number for p in pages]
+
         # Use detected sections
         for sec in content.sections:
             sec_text = sec.content
             if not sec_text:
                 # Gather text from pages in this section's range
-                page_texts = []
-                for page in content.pages:
-                    if sec.page_start and sec.page_end:
-                        if sec.page_start <= page.page_number <= sec.page_end:
-                            page_texts.append(page.text)
+                page_texts: list[str] = []
+                if sec.page_start and sec.page_end:
+                    lo = bisect_left(page_numbers, sec.page_start)
+                    hi = bisect_right(page_numbers, sec.page_end)
+                    page_texts = [p.text for p in pages[lo:hi]]
                 sec_text = "\n".join(page_texts)
             if sec_text.strip():
                 section_groups.append((sec.title, sec_text, sec.page_start))
@@ -161,35 +369,62 @@ def chunk_document(content: ExtractedContent) -> list[Chunk]:
         # No sections detected — treat entire doc as one section
         section_groups.append(("Full Document", content.raw_text, 1))
 
-    # Chunk each section
+    section_groups = [g for g in section_groups if g[1].strip()]
+    section_texts = [text for _, text, _ in section_groups]
+
+    # Chunk each section — fan out to worker processes for very large documents
+    if len(section_texts) > 1 and sum(map(len, section_texts)) >= _PARALLEL_MIN_CHARS:
+        workers = min(os.cpu_count() or 1, len(section_texts))
+        logger.info("Chunking sections in parallel", sections=len(section_texts), workers=workers)
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            split_sections = list(
+                pool.map(
+                    _chunk_one_section,
+                    section_texts,
+                    repeat(max_tokens),
+                    repeat(overlap_tokens),
+                    repeat(strategy),
+                    chunksize=4,
+                )
+            )
+    else:
+        split_sections = [
+            _chunk_one_section(text, max_tokens, overlap_tokens, strategy)
+            for text in section_texts
+        ]
+
+    # Build Chunk objects in order; chunk_index is assigned here, after the gather
     chunks: list[Chunk] = []
     chunk_index = 0
 
-    for section_name, section_text, page_start in section_groups:
-        if not section_text.strip():
-            continue
-
-        text_chunks = _split_text(section_text, max_tokens, overlap_tokens)
-        for chunk_text in text_chunks:
-            token_count = _count_tokens(chunk_text)
+    # Every chunk of the document points at the same strings and one shared
+    # (frozen) ChunkMeta. Fields are already typed, so model_construct skips
+    # re-validating them per chunk.
+    doc_id = sys.intern(content.doc_id)
+    shared_meta = ChunkMeta(
+        filename=sys.intern(content.filename),
+        format=sys.intern(content.format.value),
+    )
 
+    for (section_name, _, page_start), text_chunks in zip(section_groups, split_sections):
+        section_name = sys.intern(section_name)
+        for chunk_text, token_count in text_chunks:
             # Skip trivially small chunks
-            if token_count < 20:
+            if token_count < _MIN_CHUNK_TOKENS:
                 continue
 
             chunks.append(
-                Chunk(
-                    doc_id=content.doc_id,
+                Chunk.model_construct(
+                    doc_id=doc_id,
                     text=chunk_text,
                     section_name=section_name,
                     page_number=page_start,
                     chunk_index=chunk_index,
                     token_count=token_count,
                     upload_timestamp=content.upload_timestamp,
-                    metadata={
-                        "filename": content.filename,
-                        "format": content.format.value,
-                    },
+                    metadata=shared_meta,
                 )
             )
             chunk_index += 1
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import orjson
+
 from src.logger import get_logger
 from src.models.report import ComplianceReport
 
@@ -22,9 +23,10 @@ def save_json_report(report: ComplianceReport, output_dir: str | Path) -> Path:
     filename = f"report_{report.report_id}.json"
     path = output_dir / filename
 
-    data = report.model_dump(mode="json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+    # orjson serialises datetimes and enums natively, so dump Python objects
+    # directly instead of coercing everything to strings first
+    data = report.model_dump(mode="python")
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     logger.info("JSON report saved", path=str(path))
     return path
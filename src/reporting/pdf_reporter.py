@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 from reportlab.lib import colors
@@ -9,6 +10,7 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import cm, mm
 from reportlab.platypus import (
+    LongTable,
     Paragraph,
     SimpleDocTemplate,
     Spacer,
@@ -35,6 +37,57 @@ _STATUS_COLORS = {
     DQCStatus.PARTIAL: colors.HexColor("#F57C00"),
 }
 
+# Hex strings and the coloured status markup, built once instead of per finding
+_STATUS_HEX = {status: color.hexval() for status, color in _STATUS_COLORS.items()}
+_STATUS_MARKUP = {
+    status: f"<font color='{_STATUS_HEX.get(status, colors.black.hexval())}'>{status.value}</font>"
+    for status in DQCStatus
+}
+
+
+def _finding_rows(report: ComplianceReport, style: ParagraphStyle) -> Iterator[list]:
+    """Yield one table row per finding: item id, status, risk, confidence, details."""
+    for finding in report.findings:
+        details = f"<i>Justification:</i> {finding.justification}"
+        if finding.recommendation:
+            details += f"<br/><i>Recommendation:</i> {finding.recommendation}"
+        yield [
+            Paragraph(f"<b>{finding.dqc_item_id}</b>", style),
+            Paragraph(_STATUS_MARKUP[finding.status], style),
+            finding.risk_level.value,
+            f"{finding.confidence_score:.0%}",
+            Paragraph(details, style),
+        ]
+
+
+def _findings_table(report: ComplianceReport, style: ParagraphStyle) -> LongTable:
+    """All findings as one LongTable, split across pages with the header repeated.
+
+    One flowable for the whole section instead of 3–4 per finding; LongTable
+    also avoids re-measuring every row when ReportLab splits it across pages.
+    ``splitInRow`` lets a finding taller than a page (long justification)
+    continue on the next page instead of raising ``LayoutError``.
+    """
+    header = ["Item", "Status", "Risk", "Confidence", "Details"]
+    table = LongTable(
+        [header, *_finding_rows(report, style)],
+        colWidths=[2.4 * cm, 2 * cm, 2 * cm, 2.2 * cm, 8.4 * cm],  # 17 cm frame
+        repeatRows=1,
+        splitInRow=1,
+    )
+    table.setStyle(
+        TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1565C0")),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ]
+        )
+    )
+    return table
+
 
 def generate_pdf_report(report: ComplianceReport, output_dir: str | Path) -> Path:
     """Generate a styled PDF compliance report.
@@ -129,24 +182,9 @@ def generate_pdf_report(report: ComplianceReport, output_dir: str | Path) -> Pat
 
     # ── Detailed Findings ────────────────────────────────────────
     elements.append(Paragraph("Detailed Findings", heading_style))
-    for finding in report.findings:
-        status_color = _STATUS_COLORS.get(finding.status, colors.black)
-        elements.append(
-            Paragraph(
-                f"<b>{finding.dqc_item_id}</b> — "
-                f"<font color='{status_color.hexval()}'>{finding.status.value}</font> "
-                f"(Risk: {finding.risk_level.value}, Confidence: {finding.confidence_score:.0%})",
-                body_style,
-            )
-        )
-        elements.append(
-            Paragraph(f"<i>Justification:</i> {finding.justification}", body_style)
-        )
-        if finding.recommendation:
-            elements.append(
-                Paragraph(f"<i>Recommendation:</i> {finding.recommendation}", body_style)
-            )
-        elements.append(Spacer(1, 4 * mm))
+    if report.findings:
+        elements.append(_findings_table(report, body_style))
+    elements.append(Spacer(1, 8 * mm))
 
     # ── Recommendations ──────────────────────────────────────────
     if report.recommendations:
@@ -4,14 +4,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+import numpy as np
 from langchain_core.documents import Document as LCDocument
 
 from src.config import get_settings
 from src.logger import get_logger
-from src.vectorstore.chroma_store import VectorStore
+from src.vectorstore.chroma_store import VectorStore, get_vector_store
 
 logger = get_logger(__name__)
 
+# Rows of an int8 matrix dequantized at a time while scoring (~12 MB at 768 dims)
+_DEQUANT_BLOCK_ROWS = 4096
+
 
 @dataclass
 class RetrievalResult:
@@ -21,16 +25,73 @@ class RetrievalResult:
     chunks: list[LCDocument] = field(default_factory=list)
     scores: list[float] = field(default_factory=list)
     total_tokens: int = 0
+    context_text: str = ""
+
+    def __post_init__(self) -> None:
+        # RetrievalEngine passes context_text in; only assemble it for
+        # results built by hand
+        if self.chunks and not self.context_text:
+            self.context_text, _ = _assemble_context(self.chunks)
+
 
-    @property
-    def context_text(self) -> str:
-        """Assemble retrieved chunks into a single context string."""
-        parts: list[str] = []
-        for doc in self.chunks:
-            section = doc.metadata.get("section_name", "Unknown Section")
-            page = doc.metadata.get("page_number", "?")
-            parts.append(f"[Section: {section} | Page: {page}]\n{doc.page_content}")
-        return "\n\n---\n\n".join(parts)
+def _assemble_context(chunks: list[LCDocument]) -> tuple[str, int]:
+    """Build the context string and estimated token total in one pass over `chunks`."""
+    parts: list[str] = []
+    total_tokens = 0
+    for doc in chunks:
+        md = doc.metadata
+        section = md.get("section_name", "Unknown Section")
+        page = md.get("page_number", "?")
+        parts.append(f"[Section: {section} | Page: {page}]\n{doc.page_content}")
+        total_tokens += md.get("token_count", len(doc.page_content.split()))
+    return "\n\n---\n\n".join(parts), total_tokens
+
+
+@dataclass
+class _DocVectors:
+    """A document's chunk vectors, cached for batched scoring.
+
+    With ``quantized`` the matrix is int8 with a per-dimension scale; squared
+    norms are always taken from the original float32 vectors. Scoring then
+    casts ``_DEQUANT_BLOCK_ROWS`` rows at a time to float32 for a BLAS matmul:
+    the cached matrix stays 4x smaller and peak memory grows by one block
+    rather than a full copy, while every query re-pays the casts (about the
+    speed of the float32 path, never faster).
+    """
+
+    docs: list[LCDocument]
+    vectors: np.ndarray
+    sq_norms: np.ndarray
+    scale: np.ndarray | None = None
+
+    @classmethod
+    def build(cls, docs: list[LCDocument], vectors: np.ndarray, quantize: bool) -> _DocVectors:
+        sq_norms = np.einsum("ij,ij->i", vectors, vectors)
+        if not quantize:
+            return cls(docs, vectors, sq_norms)
+        scale = np.abs(vectors).max(axis=0) / 127.0
+        scale[scale == 0] = 1.0
+        quantized = np.round(vectors / scale).astype(np.int8)
+        return cls(docs, quantized, sq_norms, scale.astype(np.float32))
+
+    def distances(self, queries: np.ndarray) -> np.ndarray:
+        """Squared L2 distance from each query row to each chunk vector."""
+        if self.scale is None:
+            dots = queries @ self.vectors.T
+        else:
+            # Fold the chunk scale into the queries once; each block is then a
+            # plain float32 cast of the int8 rows
+            scaled = (queries * self.scale).astype(np.float32)
+            dots = np.empty((len(queries), len(self.vectors)), dtype=np.float32)
+            for start in range(0, len(self.vectors), _DEQUANT_BLOCK_ROWS):
+                block = self.vectors[start : start + _DEQUANT_BLOCK_ROWS]
+                dots[:, start : start + len(block)] = scaled @ block.T.astype(np.float32)
+        dists = (
+            np.einsum("ij,ij->i", queries, queries)[:, None]
+            + self.sq_norms[None, :]
+            - 2.0 * dots
+        )
+        return np.maximum(dists, 0.0)
 
 
 class RetrievalEngine:
@@ -38,7 +99,8 @@ class RetrievalEngine:
 
     def __init__(self, vector_store: VectorStore | None = None) -> None:
         self._settings = get_settings()
-        self._store = vector_store or VectorStore()
+        self._store = vector_store or get_vector_store()
+        self._doc_vectors: dict[str, _DocVectors] = {}
 
     def retrieve(
         self,
@@ -63,20 +125,85 @@ class RetrievalEngine:
 
         chunks = [doc for doc, _ in results]
         scores = [score for _, score in results]
+        return self._build_result(query, chunks, scores)
 
+    def retrieve_batch(
+        self,
+        queries: list[str],
+        doc_id: str,
+        k: int | None = None,
+    ) -> list[RetrievalResult]:
+        """Run semantic search for many queries against one document at once.
+
+        The document's chunk vectors are loaded once and scored against all
+        query embeddings in a single matrix product, instead of one Chroma
+        query per item. Distances are squared L2 (the collection's metric),
+        converted with the store's relevance function, so scores and the
+        threshold match `retrieve`.
+        """
+        k = k or self._settings.retrieval_top_k
+        threshold = self._settings.retrieval_score_threshold
+
+        cached = self._load_doc_vectors(doc_id)
+        docs = cached.docs
+        if not docs or not queries:
+            return [self._build_result(q, [], []) for q in queries]
+
+        dists = cached.distances(self._store.embed_queries(queries))
+
+        k = min(k, len(docs))
+        top = np.argpartition(dists, k - 1, axis=1)[:, :k]
+
+        results: list[RetrievalResult] = []
+        for row, query in enumerate(queries):
+            idx = top[row][np.argsort(dists[row, top[row]])]
+            chunks: list[LCDocument] = []
+            scores: list[float] = []
+            for i in idx:
+                score = self._store.relevance_score(float(dists[row, i]))
+                if score >= threshold:
+                    chunks.append(docs[i])
+                    scores.append(score)
+            results.append(self._build_result(query, chunks, scores))
+        return results
+
+    def _load_doc_vectors(self, doc_id: str) -> _DocVectors:
+        """Fetch (and cache) a document's chunk vectors for `retrieve_batch`."""
+        cached = self._doc_vectors.get(doc_id)
+        if cached is None:
+            docs, vectors = self._store.get_doc_vectors(doc_id)
+            cached = _DocVectors.build(
+                docs, vectors, quantize=self._settings.retrieval_quantize_int8 and bool(docs)
+            )
+            if docs:
+                self._doc_vectors[doc_id] = cached
+        return cached
+
+    def invalidate(self, doc_id: str | None = None) -> None:
+        """Drop cached vectors for one document (or all) after re-indexing."""
+        if doc_id is None:
+            self._doc_vectors.clear()
+        else:
+            self._doc_vectors.pop(doc_id, None)
+
+    def _build_result(
+        self,
+        query: str,
+        chunks: list[LCDocument],
+        scores: list[float],
+    ) -> RetrievalResult:
         # Group by section and sort for reading order
         chunks = self._group_by_section(chunks)
 
-        # Estimate tokens
-        total_tokens = sum(
-            doc.metadata.get("token_count", len(doc.page_content.split())) for doc in chunks
-        )
+        # Context string and token estimate in a single pass
+        context_text, total_tokens = _assemble_context(chunks)
 
         result = RetrievalResult(
             query=query,
             chunks=chunks,
             scores=scores,
             total_tokens=total_tokens,
+            context_text=context_text,
         )
 
         logger.info(
@@ -89,21 +216,22 @@ class RetrievalEngine:
 
     def _group_by_section(self, chunks: list[LCDocument]) -> list[LCDocument]:
         """Group chunks by section, then sort by page/chunk_index within each."""
-        section_map: dict[str, list[LCDocument]] = {}
+        # Sections keep first-seen order: rank them, then do one stable sort on
+        # (section rank, page, chunk_index) keys built once per chunk
+        rank: dict[str, int] = {}
+        keys = []
         for doc in chunks:
-            section = doc.metadata.get("section_name", "")
-            section_map.setdefault(section, []).append(doc)
-
-        ordered: list[LCDocument] = []
-        for _section, docs in section_map.items():
-            docs.sort(
-                key=lambda d: (
-                    d.metadata.get("page_number", 0),
-                    d.metadata.get("chunk_index", 0),
+            meta = doc.metadata
+            section = meta.get("section_name", "")
+            keys.append(
+                (
+                    rank.setdefault(section, len(rank)),
+                    meta.get("page_number", 0),
+                    meta.get("chunk_index", 0),
                 )
             )
-            ordered.extend(docs)
-        return ordered
+        order = sorted(range(len(chunks)), key=keys.__getitem__)
+        return [chunks[i] for i in order]
 
     def retrieve_for_dqc_item(
         self,
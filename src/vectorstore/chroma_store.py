@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
+import time
+from functools import lru_cache
+
+import numpy as np
 from langchain_chroma import Chroma
 from langchain_core.documents import Document as LCDocument
 from langchain_core.embeddings import Embeddings
@@ -13,6 +19,9 @@ from src.models.chunk import Chunk
 
 logger = get_logger(__name__)
 
+# Chroma collection names allow only these characters
+_UNSAFE_NAME_CHARS = re.compile(r"[^a-zA-Z0-9._-]")
+
 
 class VectorStore:
     """Wraps LangChain Chroma for chunk storage, embedding, and retrieval."""
@@ -29,62 +38,205 @@ class VectorStore:
             embedding_function=self._embeddings,
             persist_directory=self._settings.chroma_persist_dir,
         )
+        # Per-document collections (chroma_collection_per_doc), opened lazily
+        # and keyed by collection name
+        self._per_doc = self._settings.chroma_collection_per_doc
+        self._doc_stores: dict[str, Chroma] = {}
         logger.info(
             "VectorStore initialised",
             collection=self._settings.chroma_collection_name,
             persist_dir=self._settings.chroma_persist_dir,
         )
 
+    # ── Collections ──────────────────────────────────────────────
+
+    def _doc_collection_name(self, doc_id: str) -> str:
+        return f"{self._settings.chroma_collection_name}__{_UNSAFE_NAME_CHARS.sub('_', doc_id)}"
+
+    def _collection_store(self, name: str) -> Chroma:
+        """Open (get-or-create) a per-doc collection on the shared client."""
+        store = self._doc_stores.get(name)
+        if store is None:
+            store = Chroma(
+                collection_name=name,
+                embedding_function=self._embeddings,
+                client=self._store._client,
+            )
+            self._doc_stores[name] = store
+        return store
+
+    def _store_for(self, doc_id: str | None) -> Chroma:
+        """The Chroma store to write `doc_id`'s chunks to (the shared one unless per-doc)."""
+        if not (self._per_doc and doc_id):
+            return self._store
+        return self._collection_store(self._doc_collection_name(doc_id))
+
+    def _read_stores(self, doc_id: str | None) -> list[Chroma]:
+        """The stores a read scoped to `doc_id` (or the whole corpus) must search.
+
+        Never creates a collection: in per-doc mode an unknown `doc_id` yields
+        no stores, and no `doc_id` yields every document's collection.
+        """
+        if not self._per_doc:
+            return [self._store]
+        if not doc_id:
+            return [self._collection_store(name) for name in self._per_doc_collection_names()]
+        name = self._doc_collection_name(doc_id)
+        if name not in self._doc_stores and name not in self._per_doc_collection_names():
+            return []
+        return [self._collection_store(name)]
+
+    def _doc_filter(self, doc_id: str | None) -> dict | None:
+        # A per-doc collection holds only that document, so no metadata filter
+        # is needed during the ANN search
+        if not doc_id or self._per_doc:
+            return None
+        return {"doc_id": doc_id}
+
     # ── Write ────────────────────────────────────────────────────
 
-    def add_chunks(self, chunks: list[Chunk], batch_size: int = 100) -> list[str]:
-        """Embed and store a list of Chunk objects in batches."""
+    def add_chunks(self, chunks: list[Chunk], batch_size: int = 2048) -> list[str]:
+        """Embed all chunks up front, then write them to Chroma with precomputed vectors.
+
+        `batch_size` only caps a single embedding request; providers batch
+        further internally, so large calls amortise the round-trip.
+        """
         if not chunks:
             return []
 
-        import time
-
-        documents = [
-            LCDocument(
-                page_content=chunk.text,
-                metadata=chunk.to_vectorstore_metadata(),
-            )
-            for chunk in chunks
-        ]
+        texts = [chunk.text for chunk in chunks]
+        metadatas = [chunk.to_vectorstore_metadata() for chunk in chunks]
         ids = [chunk.chunk_id for chunk in chunks]
 
         logger.info("Adding chunks to vector store", count=len(chunks))
 
-        for i in range(0, len(documents), batch_size):
-            batch_docs = documents[i : i + batch_size]
-            batch_ids = ids[i : i + batch_size]
+        embeddings: list[list[float]] = []
+        for i in range(0, len(texts), batch_size):
+            embeddings.extend(self._embed_with_retry(texts[i : i + batch_size], start=i))
 
-            try:
-                self._store.add_documents(batch_docs, ids=batch_ids)
-                logger.debug(f"Added batch {i//batch_size + 1}/{(len(documents) + batch_size - 1)//batch_size}")
-            except Exception as e:
-                logger.error(f"Error adding batch starting at index {i}: {e}")
-                # Wait and retry once on failure
-                time.sleep(5)
-                try:
-                    self._store.add_documents(batch_docs, ids=batch_ids)
-                except Exception as retry_e:
-                    logger.error(f"Retry failed for batch starting at index {i}: {retry_e}")
-                    raise retry_e
+        self._upsert(ids, embeddings, metadatas, texts)
 
         logger.info("Chunks stored", count=len(ids))
         return ids
 
+    async def aadd_chunks(self, chunks: list[Chunk], batch_size: int = 2048) -> list[str]:
+        """Async variant of `add_chunks` that embeds all batches concurrently.
+
+        The embedding requests are network-bound, so they are issued together
+        with `asyncio.gather`; the Chroma write happens once they have all returned.
+        """
+        if not chunks:
+            return []
+
+        texts = [chunk.text for chunk in chunks]
+        metadatas = [chunk.to_vectorstore_metadata() for chunk in chunks]
+        ids = [chunk.chunk_id for chunk in chunks]
+
+        logger.info("Adding chunks to vector store (async)", count=len(chunks))
+
+        batches = await asyncio.gather(
+            *(
+                self._aembed_with_retry(texts[i : i + batch_size], start=i)
+                for i in range(0, len(texts), batch_size)
+            )
+        )
+        embeddings = [vec for batch in batches for vec in batch]
+
+        # Chroma's client is synchronous; keep the disk write off the event loop
+        await asyncio.to_thread(self._upsert, ids, embeddings, metadatas, texts)
+
+        logger.info("Chunks stored", count=len(ids))
+        return ids
+
+    def _upsert(
+        self,
+        ids: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict],
+        texts: list[str],
+    ) -> None:
+        """Write precomputed vectors to the collection(s)."""
+        if not self._per_doc:
+            self._write(self._store, ids, embeddings, metadatas, texts)
+            return
+
+        rows_by_doc: dict[str, list[int]] = {}
+        for i, meta in enumerate(metadatas):
+            rows_by_doc.setdefault(meta["doc_id"], []).append(i)
+        for doc_id, rows in rows_by_doc.items():
+            self._write(
+                self._store_for(doc_id),
+                [ids[i] for i in rows],
+                [embeddings[i] for i in rows],
+                [metadatas[i] for i in rows],
+                [texts[i] for i in rows],
+            )
+
+    def _write(
+        self,
+        store: Chroma,
+        ids: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict],
+        texts: list[str],
+    ) -> None:
+        # Chroma caps the number of records a single write may carry
+        max_write = self._store._client.get_max_batch_size()
+        for i in range(0, len(ids), max_write):
+            store._collection.upsert(
+                ids=ids[i : i + max_write],
+                embeddings=embeddings[i : i + max_write],
+                metadatas=metadatas[i : i + max_write],
+                documents=texts[i : i + max_write],
+            )
+
+    def _embed_with_retry(self, texts: list[str], start: int) -> list[list[float]]:
+        """Embed one batch of texts, retrying once after a short back-off."""
+        try:
+            return self._embeddings.embed_documents(texts)
+        except Exception as e:
+            logger.error(f"Error embedding batch starting at index {start}: {e}")
+            # Wait and retry once on failure
+            time.sleep(5)
+            try:
+                return self._embeddings.embed_documents(texts)
+            except Exception as retry_e:
+                logger.error(f"Retry failed for batch starting at index {start}: {retry_e}")
+                raise retry_e
+
+    async def _aembed_with_retry(self, texts: list[str], start: int) -> list[list[float]]:
+        """Async counterpart of `_embed_with_retry`."""
+        try:
+            return await self._embeddings.aembed_documents(texts)
+        except Exception as e:
+            logger.error(f"Error embedding batch starting at index {start}: {e}")
+            await asyncio.sleep(5)
+            try:
+                return await self._embeddings.aembed_documents(texts)
+            except Exception as retry_e:
+                logger.error(f"Retry failed for batch starting at index {start}: {retry_e}")
+                raise retry_e
+
     # ── Delete ───────────────────────────────────────────────────
 
     def delete_by_doc_id(self, doc_id: str) -> None:
         """Remove all chunks belonging to a specific document."""
         logger.info("Deleting chunks for doc", doc_id=doc_id)
-        self._store._collection.delete(where={"doc_id": doc_id})
+        if not self._per_doc:
+            self._store._collection.delete(where={"doc_id": doc_id})
+            return
+        name = self._doc_collection_name(doc_id)
+        self._doc_stores.pop(name, None)
+        if name in self._per_doc_collection_names():
+            self._store._client.delete_collection(name)
 
     def reset_collection(self) -> None:
         """Drop and recreate the collection (for re-indexing)."""
         logger.warning("Resetting entire vector store collection")
+        if self._per_doc:
+            for name in self._per_doc_collection_names():
+                self._store._client.delete_collection(name)
+            self._doc_stores.clear()
         self._store._client.delete_collection(self._settings.chroma_collection_name)
         self._store = Chroma(
             collection_name=self._settings.chroma_collection_name,
@@ -103,23 +255,89 @@ class VectorStore:
     ) -> list[tuple[LCDocument, float]]:
         """Search for similar documents, optionally filtered by doc_id."""
         k = k or self._settings.retrieval_top_k
-        filter_dict = {"doc_id": doc_id} if doc_id else None
+        stores = self._read_stores(doc_id)
+        results: list[tuple[LCDocument, float]] = []
+        for store in stores:
+            results.extend(
+                store.similarity_search_with_relevance_scores(
+                    query,
+                    k=k,
+                    filter=self._doc_filter(doc_id),
+                    score_threshold=score_threshold or self._settings.retrieval_score_threshold,
+                )
+            )
+        if len(stores) > 1:
+            # Corpus-wide search over per-doc collections: keep the overall top k
+            results.sort(key=lambda pair: pair[1], reverse=True)
+            del results[k:]
+        return results
+
+    def get_doc_vectors(self, doc_id: str) -> tuple[list[LCDocument], np.ndarray]:
+        """Load every stored chunk of a document with its embedding.
 
-        results = self._store.similarity_search_with_relevance_scores(
-            query,
-            k=k,
-            filter=filter_dict,
-            score_threshold=score_threshold or self._settings.retrieval_score_threshold,
+        Returns the chunks and a float32 ``(n_chunks, dim)`` matrix in the same order.
+        """
+        stores = self._read_stores(doc_id)
+        if not stores:
+            return [], np.empty((0, 0), dtype=np.float32)
+        data = stores[0]._collection.get(
+            where=self._doc_filter(doc_id),
+            include=["embeddings", "documents", "metadatas"],
         )
-        return results
+        docs = [
+            LCDocument(id=chunk_id, page_content=text, metadata=meta or {})
+            for chunk_id, text, meta in zip(data["ids"], data["documents"], data["metadatas"])
+        ]
+        if not docs:
+            return [], np.empty((0, 0), dtype=np.float32)
+        return docs, np.asarray(data["embeddings"], dtype=np.float32)
+
+    def embed_queries(self, queries: list[str]) -> np.ndarray:
+        """Embed search queries as a float32 ``(n_queries, dim)`` matrix."""
+        # embed_query, not embed_documents: providers such as Gemini use a
+        # different task type for queries than for stored passages
+        return np.asarray([self._embeddings.embed_query(q) for q in queries], dtype=np.float32)
+
+    def relevance_score(self, distance: float) -> float:
+        """Convert a raw distance into the same 0–1 relevance scale as `similarity_search`."""
+        return self._store._select_relevance_score_fn()(distance)
 
     def as_retriever(self, doc_id: str | None = None, k: int | None = None):
-        """Return a LangChain VectorStoreRetriever."""
+        """Return a LangChain VectorStoreRetriever.
+
+        With per-doc collections a retriever searches a single collection, so
+        `doc_id` is required and must already be indexed.
+        """
+        if self._per_doc and not doc_id:
+            raise ValueError("as_retriever needs a doc_id when collections are per document")
+        stores = self._read_stores(doc_id)
+        if not stores:
+            raise ValueError(f"No chunks stored for document {doc_id!r}")
         search_kwargs: dict = {"k": k or self._settings.retrieval_top_k}
-        if doc_id:
-            search_kwargs["filter"] = {"doc_id": doc_id}
-        return self._store.as_retriever(search_kwargs=search_kwargs)
+        if filter_dict := self._doc_filter(doc_id):
+            search_kwargs["filter"] = filter_dict
+        return stores[0].as_retriever(search_kwargs=search_kwargs)
+
+    def _per_doc_collection_names(self) -> list[str]:
+        prefix = f"{self._settings.chroma_collection_name}__"
+        # chromadb 0.6.x lists names as plain strings, other versions as Collections
+        names = (getattr(c, "name", c) for c in self._store._client.list_collections())
+        return [name for name in names if name.startswith(prefix)]
 
     @property
     def collection_count(self) -> int:
-        return self._store._collection.count()
+        count = self._store._collection.count()
+        if self._per_doc:
+            for name in self._per_doc_collection_names():
+                count += self._store._client.get_collection(name).count()
+        return count
+
+
+@lru_cache(maxsize=1)
+def get_vector_store() -> VectorStore:
+    """Return a cached VectorStore bound to the process-wide settings.
+
+    Building the Chroma client and embedding model is expensive, so callers
+    using the default settings share one instance across requests.
+    """
+    return VectorStore()
@@ -2,15 +2,60 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import pytest
-from fastapi.testclient import TestClient
 
-from src.api.main import app
+from src.config import Settings
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+_REPO_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    # One app instance and lifespan start-up for the whole session. The app is
+    # imported here, not at module level, so collecting or deselecting these
+    # tests does not pay for building the API.
+    from fastapi.testclient import TestClient
+
+    from src.api.main import app
+
+    with TestClient(app) as c:
+        yield c
 
 
-@pytest.fixture
-def client():
-    return TestClient(app)
+@pytest.fixture(scope="session")
+def fake_pdf(tmp_path_factory) -> Path:
+    """A dummy PDF on disk, written once per session."""
+    path = tmp_path_factory.mktemp("pdfs") / "fake.pdf"
+    path.write_bytes(b"%PDF-1.4 fake")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path, monkeypatch) -> Iterator[Settings]:
+    """Point the router's and the background pipeline's data paths at a fresh temp dir."""
+    from src.api.routers import v1
+    from src.orchestration import orchestrator
+
+    settings = Settings(
+        upload_dir=str(tmp_path / "uploads"),
+        report_dir=str(tmp_path / "reports"),
+        audit_db_path=str(tmp_path / "audit.db"),
+        chroma_persist_dir=str(tmp_path / "vectordb"),
+    )
+    Path(settings.upload_dir).mkdir()
+    Path(settings.report_dir).mkdir()
+    monkeypatch.setattr(v1, "settings", settings)
+    monkeypatch.setattr(orchestrator, "get_settings", lambda: settings)
+    v1._get_audit_logger.cache_clear()
+    yield settings
+    v1._get_audit_logger.cache_clear()
 
 
 class TestHealthEndpoint:
@@ -23,34 +68,25 @@ class TestHealthEndpoint:
 
 
 class TestDocumentUpload:
-    def test_upload_no_file_returns_422(self, client: TestClient):
-        resp = client.post("/api/v1/documents/upload")
-        assert resp.status_code == 422
-
-    def test_upload_unsupported_format(self, client: TestClient, tmp_path):
-        f = tmp_path / "test.txt"
-        f.write_text("hello")
-        with open(f, "rb") as fp:
-            resp = client.post(
-                "/api/v1/documents/upload",
-                files={"file": ("test.txt", fp, "text/plain")},
-            )
-        assert resp.status_code in (400, 422)
-
-    def test_upload_valid_pdf(self, client: TestClient, tmp_path):
-        f = tmp_path / "test.pdf"
-        f.write_bytes(b"%PDF-1.4 fake content")
-        with open(f, "rb") as fp:
-            resp = client.post(
-                "/api/v1/documents/upload",
-                files={"file": ("test.pdf", fp, "application/pdf")},
-            )
-        assert resp.status_code == 200
-        data = resp.json()
-        assert "doc_id" in data
-        assert data["filename"] == "test.pdf"
-        assert data["size_bytes"] > 0
-        assert "path" in data
+    @pytest.mark.parametrize(
+        "name,body,content_type,expected",
+        [
+            (None, None, None, {422}),
+            ("test.txt", b"hello", "text/plain", {400, 422}),
+            ("test.pdf", b"%PDF-1.4 fake content", "application/pdf", {200}),
+        ],
+        ids=["no-file", "unsupported-format", "valid-pdf"],
+    )
+    def test_upload(self, client: TestClient, name, body, content_type, expected):
+        files = {"file": (name, body, content_type)} if name else None
+        resp = client.post("/api/v1/documents/upload", files=files)
+        assert resp.status_code in expected
+        if resp.status_code == 200:
+            data = resp.json()
+            assert "doc_id" in data
+            assert data["filename"] == name
+            assert data["size_bytes"] > 0
+            assert "path" in data
 
 
 class TestDocumentList:
@@ -61,6 +97,11 @@ class TestDocumentList:
         assert "documents" in data
         assert isinstance(data["documents"], list)
 
+    def test_list_is_isolated_per_test(self, client: TestClient):
+        # The upload in TestDocumentUpload went to that test's own temp dir
+        resp = client.get("/api/v1/documents")
+        assert resp.json()["documents"] == []
+
 
 class TestAnalysisStart:
     def test_start_file_not_found(self, client: TestClient):
@@ -70,17 +111,22 @@ class TestAnalysisStart:
         )
         assert resp.status_code == 404
 
-    def test_start_returns_job_id(self, client: TestClient, tmp_path):
-        f = tmp_path / "doc.pdf"
-        f.write_bytes(b"%PDF-1.4 fake")
+    def test_start_returns_job_id(
+        self, client: TestClient, fake_pdf: Path, isolated_settings: Settings
+    ):
+        before = sorted(_REPO_DATA_DIR.rglob("*"))
         resp = client.post(
             "/api/v1/analysis/start",
-            json={"file_path": str(f)},
+            json={"file_path": str(fake_pdf)},
         )
         assert resp.status_code == 200
         data = resp.json()
         assert "job_id" in data
         assert data["status"] == "started"
+        # The background pipeline (run by TestClient before returning) wrote
+        # its audit DB into the temp dir and left the repo's data/ untouched
+        assert Path(isolated_settings.audit_db_path).exists()
+        assert sorted(_REPO_DATA_DIR.rglob("*")) == before
 
 
 class TestAnalysisStatus:
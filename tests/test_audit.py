@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -18,10 +20,19 @@ from src.models.report import (
 )
 
 
+@pytest.fixture(scope="session")
+def shared_audit_logger() -> Iterator[AuditLogger]:
+    """One in-memory audit DB (schema created once) shared by the whole session."""
+    audit = AuditLogger(":memory:")
+    yield audit
+    audit.close()
+
+
 @pytest.fixture
-def audit_logger(tmp_path) -> AuditLogger:
-    db_path = tmp_path / "audit" / "test_audit.db"
-    return AuditLogger(db_path)
+def audit_logger(shared_audit_logger: AuditLogger) -> Iterator[AuditLogger]:
+    # Each test's writes are rolled back, so tests still see an empty log
+    with shared_audit_logger.savepoint():
+        yield shared_audit_logger
 
 
 @pytest.fixture
@@ -63,6 +74,8 @@ class TestAuditLogger:
         db_path = tmp_path / "new_audit.db"
         AuditLogger(db_path)
         assert db_path.exists()
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
 
     def test_init_creates_parent_dirs(self, tmp_path):
         db_path = tmp_path / "nested" / "deep" / "audit.db"
@@ -82,12 +95,35 @@ class TestAuditLogger:
         assert record["model_version"] == "gemini-2.5-flash"
 
     def test_query_recent(self, audit_logger: AuditLogger, sample_report: ComplianceReport):
-        for i in range(5):
-            report = sample_report.model_copy(update={"report_id": f"report-{i}"})
-            audit_logger.log_evaluation(report, doc_id=f"doc-{i}", user="user")
+        # Shallow field mapping (nested models kept as-is); model_construct skips validation
+        base = dict(sample_report)
+        audit_logger.log_evaluations_bulk(
+            [
+                (
+                    ComplianceReport.model_construct(**{**base, "report_id": f"report-{i}"}),
+                    f"doc-{i}",
+                    "user",
+                )
+                for i in range(5)
+            ]
+        )
 
         recent = audit_logger.query_recent(limit=3)
         assert len(recent) == 3
+        assert {r["evaluation_id"] for r in recent} <= {f"report-{i}" for i in range(5)}
+
+    def test_bulk_empty(self, audit_logger: AuditLogger):
+        audit_logger.log_evaluations_bulk([])
+        assert audit_logger.query_recent() == []
+
+    def test_bulk_writes_every_item(
+        self, audit_logger: AuditLogger, sample_report: ComplianceReport
+    ):
+        audit_logger.log_evaluations_bulk(
+            [(sample_report, "d1", "alice"), (sample_report, "d2", "bob")]
+        )
+        assert {r["doc_id"] for r in audit_logger.query_recent()} == {"d1", "d2"}
+        assert len({r["audit_id"] for r in audit_logger.query_recent()}) == 2
 
     def test_query_by_user(self, audit_logger: AuditLogger, sample_report: ComplianceReport):
         audit_logger.log_evaluation(sample_report, doc_id="d1", user="alice")
@@ -113,3 +149,58 @@ class TestAuditLogger:
         parsed = json.loads(result_json)
         assert parsed["document"]["filename"] == "test.pdf"
         assert parsed["overall_compliance"]["score"] == 80.0
+        assert ComplianceReport.model_validate_json(result_json) == sample_report
+
+
+class TestSavepoint:
+    def test_rolls_back_writes(self, tmp_path, sample_report: ComplianceReport):
+        conn = sqlite3.connect(tmp_path / "sp.db")
+        audit = AuditLogger(tmp_path / "sp.db", conn=conn)
+        audit.log_evaluation(sample_report, doc_id="kept", user="u")
+        with audit.savepoint():
+            audit.log_evaluation(sample_report, doc_id="dropped", user="u")
+            assert len(audit.query_recent()) == 2
+        assert [r["doc_id"] for r in audit.query_recent()] == ["kept"]
+        conn.close()
+
+
+class TestInMemory:
+    def test_memory_path(self, sample_report: ComplianceReport):
+        audit = AuditLogger(":memory:")
+        audit.log_evaluation(sample_report, doc_id="d1", user="u")
+        assert len(audit.query_by_doc("d1")) == 1
+        audit.close()
+
+    def test_shared_cache_uri(self, sample_report: ComplianceReport):
+        uri = "file:audit_shared_test?mode=memory&cache=shared"
+        writer = AuditLogger(uri)
+        writer.log_evaluation(sample_report, doc_id="d1", user="u")
+        # A second logger on the same URI sees the first one's rows
+        reader = AuditLogger(uri)
+        assert len(reader.query_by_doc("d1")) == 1
+        reader.close()
+        writer.close()
+
+
+class TestConnection:
+    def test_reuses_one_connection(self, tmp_path, sample_report: ComplianceReport):
+        audit = AuditLogger(tmp_path / "a.db")
+        conn = audit._conn
+        audit.log_evaluation(sample_report, doc_id="d1", user="u")
+        audit.query_recent()
+        assert audit._conn is conn
+        audit.close()
+        assert audit._conn is None
+
+    def test_close_leaves_injected_connection_open(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "a.db")
+        AuditLogger(tmp_path / "a.db", conn=conn).close()
+        assert conn.execute("SELECT count(*) FROM audit_log").fetchone() == (0,)
+        conn.close()
+
+    def test_written_rows_visible_to_other_connections(
+        self, tmp_path, sample_report: ComplianceReport
+    ):
+        audit = AuditLogger(tmp_path / "a.db")
+        audit.log_evaluation(sample_report, doc_id="d1", user="u")
+        assert len(AuditLogger(tmp_path / "a.db").query_by_doc("d1")) == 1
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import pytest
 
+from src.config import Settings
+from src.models.chunk import ChunkMeta
 from src.models.document import (
     DocumentFormat,
     DocumentMetadata,
@@ -11,7 +13,15 @@ from src.models.document import (
     PageContent,
     Section,
 )
-from src.preprocessing.chunker import chunk_document, _count_tokens, _split_text, _sentence_split
+from src.preprocessing import chunker
+from src.preprocessing.chunker import (
+    chunk_document,
+    _count_tokens,
+    _count_tokens_batch,
+    _split_text,
+    _split_tokens,
+    _sentence_split,
+)
 
 
 class TestCountTokens:
@@ -27,6 +37,50 @@ class TestCountTokens:
         tokens = _count_tokens(text)
         assert tokens > 100
 
+    def test_special_token_text_is_counted(self):
+        # Documents may legitimately contain special-token markers
+        assert _count_tokens("<|endoftext|>") > 1
+
+    def test_batch_matches_single(self):
+        texts = ["Hello world", "", "word " * 50]
+        assert _count_tokens_batch(texts) == [_count_tokens(t) for t in texts]
+
+    def test_batch_empty(self):
+        assert _count_tokens_batch([]) == []
+
+
+class TestEncoderBackend:
+    def test_default_is_tiktoken(self):
+        assert chunker._load_encoder("tiktoken").name == "cl100k_base"
+
+    def test_encoder_loaded_once(self):
+        assert chunker._get_encoder() is chunker._get_encoder()
+
+    def test_huggingface_adapter(self):
+        from tokenizers import Tokenizer, models, pre_tokenizers
+
+        vocab = {"[UNK]": 0, "hello": 1, "world": 2}
+        tok = Tokenizer(models.WordLevel(vocab, unk_token="[UNK]"))
+        tok.pre_tokenizer = pre_tokenizers.Whitespace()
+        enc = chunker._HFEncoder(tok)
+        assert enc.encode_ordinary("hello world") == [1, 2]
+        assert enc.decode_single_token_bytes(1) == b"hello"
+
+    def test_byte_level_alphabet(self):
+        # GPT-2 byte-level BPE spells a leading space as "Ġ" and newline as "Ċ"
+        assert len(chunker._BYTE_DECODER) == 256
+        assert chunker._BYTE_DECODER["Ġ"] == ord(" ")
+        assert chunker._BYTE_DECODER["Ċ"] == ord("\n")
+
+    def test_huggingface_falls_back_to_tiktoken(self, monkeypatch):
+        from tokenizers import Tokenizer
+
+        def _offline(name):
+            raise OSError("offline")
+
+        monkeypatch.setattr(Tokenizer, "from_pretrained", staticmethod(_offline))
+        assert chunker._load_encoder("huggingface").name == "cl100k_base"
+
 
 class TestSentenceSplit:
     def test_single_sentence(self):
@@ -58,6 +112,48 @@ class TestSplitText:
         result = _split_text(text, max_tokens=50, overlap_tokens=10)
         assert len(result) > 1
 
+    def test_overlap_carries_tail_sentences(self):
+        text = ". ".join(f"This is sentence number {i}" for i in range(40))
+        result = _split_text(text, max_tokens=50, overlap_tokens=15)
+        assert len(result) > 1
+        for prev, nxt in zip(result, result[1:]):
+            # The next chunk starts with the last sentence of the previous one
+            assert nxt.split(". ")[0].rstrip(".") in prev
+
+    def test_overlap_carry_uses_cached_counts(self):
+        carry, toks, total = chunker._overlap_carry(["a", "b", "c"], [5, 4, 3], overlap_tokens=8)
+        assert carry == ["b", "c"]
+        assert toks == [4, 3]
+        assert total == 7
+
+    @pytest.mark.parametrize(
+        "overlap,expected",
+        [(0, []), (2, []), (3, ["c"]), (100, ["a", "b", "c"])],
+    )
+    def test_overlap_carry_bounds(self, overlap, expected):
+        current = ["a", "b", "c"]
+        carry, toks, _ = chunker._overlap_carry(current, [5, 4, 3], overlap_tokens=overlap)
+        assert carry == expected
+        assert len(toks) == len(expected)
+        # The carry is a copy: the caller keeps appending to it
+        assert carry is not current
+
+    def test_each_sentence_encoded_once(self, monkeypatch):
+        encoded: list[str] = []
+        batch = chunker._count_tokens_batch
+
+        def _recording_batch(texts):
+            encoded.extend(texts)
+            return batch(texts)
+
+        monkeypatch.setattr(chunker, "_count_tokens_batch", _recording_batch)
+        monkeypatch.setattr(chunker, "_count_tokens", lambda text: pytest.fail("re-encoded"))
+        text = ". ".join(f"This is sentence number {i}" for i in range(100))
+        result = _split_text(text, max_tokens=50, overlap_tokens=20)
+        assert len(result) > 1
+        # One tokenizer pass over the sentences; overlap windows reuse the counts
+        assert encoded == chunker._sentence_split(text)
+
     def test_respects_max_tokens(self):
         text = ". ".join(f"This is a reasonably long sentence number {i}" for i in range(50))
         result = _split_text(text, max_tokens=100, overlap_tokens=20)
@@ -66,6 +162,73 @@ class TestSplitText:
             assert _count_tokens(chunk) < 200  # generous upper bound
 
 
+class TestSplitTokens:
+    def test_short_text_single_window(self):
+        result = _split_tokens("Short text here.", max_tokens=100, overlap_tokens=10)
+        assert len(result) == 1
+        assert result[0] == ("Short text here.", _count_tokens("Short text here."))
+
+    def test_empty_text(self):
+        assert _split_tokens("", max_tokens=100, overlap_tokens=10) == []
+
+    def test_windows_respect_max_and_overlap(self):
+        text = ". ".join(f"This is sentence number {i}" for i in range(100))
+        result = _split_tokens(text, max_tokens=50, overlap_tokens=10)
+        assert len(result) > 1
+        assert all(count <= 50 for _, count in result)
+        # Consecutive windows share exactly overlap_tokens tokens
+        first, second = (chunker._get_encoder().encode_ordinary(t) for t, _ in result[:2])
+        assert first[-10:] == second[:10]
+
+    def test_covers_all_tokens(self):
+        text = " ".join(f"word{i}" for i in range(300))
+        result = _split_tokens(text, max_tokens=64, overlap_tokens=0)
+        assert "".join(t for t, _ in result) == text
+
+    _MULTIBYTE_TEXT = "".join(f"第{i}章 日本語のテキスト。émoji 🎉🎉 {i}\n" for i in range(150))
+
+    @pytest.mark.parametrize("max_tokens", [1, 2, 3, 37])
+    def test_multibyte_windows_rejoin_without_overlap(self, max_tokens):
+        text = self._MULTIBYTE_TEXT
+        result = _split_tokens(text, max_tokens=max_tokens, overlap_tokens=0)
+        assert all("\ufffd" not in t for t, _ in result)
+        assert "".join(t for t, _ in result) == text
+
+    def test_multibyte_windows_overlap_and_cover(self):
+        text = self._MULTIBYTE_TEXT
+        result = _split_tokens(text, max_tokens=37, overlap_tokens=5)
+        assert all("\ufffd" not in t for t, _ in result)
+        # Windows are exact slices of the source that overlap or touch, covering all of it
+        rebuilt, start = "", -1
+        for t, _ in result:
+            start = text.find(t, start + 1)
+            assert 0 <= start <= len(rebuilt)
+            rebuilt = rebuilt[:start] + t
+        assert rebuilt == text
+
+
+class TestBuildSectionMap:
+    def test_pages_follow_most_recent_section(self):
+        content = ExtractedContent(
+            filename="test.pdf",
+            format=DocumentFormat.PDF,
+            pages=[PageContent(page_number=n, text=f"p{n}") for n in range(1, 7)],
+            sections=[
+                Section(title="Intro", page_start=2),
+                Section(title="Body", page_start=4),
+                Section(title="No page"),
+            ],
+        )
+        assert chunker._build_section_map(content) == {
+            1: "Untitled",
+            2: "Intro",
+            3: "Intro",
+            4: "Body",
+            5: "Body",
+            6: "Body",
+        }
+
+
 class TestChunkDocument:
     def _make_content(
         self,
@@ -127,8 +290,8 @@ class TestChunkDocument:
         chunks = chunk_document(content)
         if chunks:
             c = chunks[0]
-            assert c.metadata["filename"] == "test.pdf"
-            assert c.metadata["format"] == "pdf"
+            assert c.metadata.filename == "test.pdf"
+            assert c.metadata.format == "pdf"
             assert c.chunk_index == 0
             assert c.token_count > 0
 
@@ -162,3 +325,111 @@ class TestChunkDocument:
         chunks = chunk_document(content)
         indices = [c.chunk_index for c in chunks]
         assert indices == list(range(len(chunks)))
+
+    def test_sentence_strategy(self, monkeypatch):
+        monkeypatch.setattr(
+            chunker, "get_settings", lambda: Settings(chunk_strategy="sentence", chunk_size=50)
+        )
+        text = ". ".join(
+            f"Sentence number {i} with some extra words to bulk it up" for i in range(20)
+        )
+        content = self._make_content(
+            sections=[Section(title="Big", page_start=1, page_end=2, content=text)],
+        )
+        chunks = chunk_document(content)
+        assert len(chunks) > 1
+        # Sentence packing never cuts a sentence in half
+        assert all(c.text.startswith("Sentence number") for c in chunks)
+
+    def test_section_text_gathered_from_pages(self):
+        page_text = " ".join(
+            f"Page {{n}} discusses compliance topic number {i}." for i in range(10)
+        )
+        pages = [PageContent(page_number=n, text=page_text.format(n=n)) for n in (3, 1, 2, 4)]
+        content = self._make_content(
+            pages=pages,
+            sections=[
+                Section(title="Early", page_start=1, page_end=2),
+                Section(title="Late", page_start=3, page_end=4),
+            ],
+        )
+        chunks = chunk_document(content)
+        by_section = {c.section_name: c.text for c in chunks}
+        assert "Page 1" in by_section["Early"] and "Page 2" in by_section["Early"]
+        assert "Page 3" not in by_section["Early"]
+        assert by_section["Late"].index("Page 3") < by_section["Late"].index("Page 4")
+
+    def test_parallel_matches_sequential(self, monkeypatch):
+        sections = [
+            Section(
+                title=f"S{n}",
+                page_start=n,
+                page_end=n,
+                content=" ".join(f"Section {n} sentence {i} about compliance." for i in range(60)),
+            )
+            for n in range(1, 4)
+        ]
+        content = self._make_content(sections=sections)
+        sequential = chunk_document(content)
+
+        monkeypatch.setattr(chunker, "_PARALLEL_MIN_CHARS", 0)
+        parallel = chunk_document(content)
+
+        assert [(c.section_name, c.text, c.chunk_index) for c in parallel] == [
+            (c.section_name, c.text, c.chunk_index) for c in sequential
+        ]
+
+    def test_chunks_share_metadata(self):
+        text = " ".join(
+            f"Sentence {i} covers a compliance requirement in detail." for i in range(200)
+        )
+        content = self._make_content(raw_text=text)
+        chunks = chunk_document(content)
+        assert len(chunks) > 1
+        assert all(c.metadata is chunks[0].metadata for c in chunks)
+        assert chunks[0].metadata == ChunkMeta(
+            filename=content.filename, format=content.format.value
+        )
+        assert all(c.chunk_id for c in chunks)
+        assert len({c.chunk_id for c in chunks}) == len(chunks)
+
+
+class TestPackRun:
+    def _pack(self, toks, taken=0, max_tokens=10, overlap=0):
+        run = [f"s{i}" for i in range(len(toks))]
+        emitted: list[str] = []
+        rest, rest_toks = chunker._pack_run(run, toks, taken, max_tokens, overlap, emitted.append)
+        return emitted, rest, rest_toks
+
+    def test_split_points(self):
+        emitted, rest, _ = self._pack([4, 4, 4, 4, 4])
+        assert emitted == ["s0 s1", "s2 s3"]
+        assert rest == ["s4"]
+
+    def test_overlap_tail_carried(self):
+        emitted, rest, rest_toks = self._pack([4, 4, 4, 4], overlap=4)
+        assert emitted == ["s0 s1", "s1 s2"]
+        assert rest == ["s2", "s3"] and rest_toks == [4, 4]
+
+    def test_open_chunk_continues(self):
+        # s0 is already open (taken=1); s1 still fits alongside it
+        emitted, rest, _ = self._pack([6, 3, 5], taken=1)
+        assert emitted == ["s0 s1"]
+        assert rest == ["s2"]
+
+    def test_empty(self):
+        assert self._pack([]) == ([], [], [])
+
+
+class TestSmallChunkPrefilter:
+    @pytest.mark.parametrize("text", ["short", "a b c d e f g h i", "1234567890"])
+    def test_short_ascii_is_below_minimum(self, text):
+        assert chunker._surely_too_small(text)
+        assert _count_tokens(text) < chunker._MIN_CHUNK_TOKENS
+
+    def test_non_ascii_not_prefiltered(self):
+        # Fewer characters than the minimum, but more tokens
+        text = "数据质量检查清单要求文档必须"
+        assert len(text) < chunker._MIN_CHUNK_TOKENS
+        assert not chunker._surely_too_small(text)
+        assert _count_tokens(text) > len(text)
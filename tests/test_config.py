@@ -41,3 +41,6 @@ class TestSettings:
     def test_get_settings_returns_instance(self):
         s = get_settings()
         assert isinstance(s, Settings)
+
+    def test_get_settings_is_cached(self):
+        assert get_settings() is get_settings()
@@ -2,29 +2,32 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.ingestion import extractor_factory
 from src.ingestion.extractor_factory import detect_format, extract_document, _file_hash
 from src.models.document import DocumentFormat
 
 
-class TestDetectFormat:
-    def test_pdf(self):
-        assert detect_format("file.pdf") == DocumentFormat.PDF
-
-    def test_docx(self):
-        assert detect_format("file.docx") == DocumentFormat.DOCX
+_DETECT_CASES = (
+    ("file.pdf", DocumentFormat.PDF),
+    ("file.docx", DocumentFormat.DOCX),
+    ("file.pptx", DocumentFormat.PPTX),
+    ("file.xlsx", DocumentFormat.XLSX),
+    ("file.PDF", DocumentFormat.PDF),
+)
 
-    def test_pptx(self):
-        assert detect_format("file.pptx") == DocumentFormat.PPTX
 
-    def test_xlsx(self):
-        assert detect_format("file.xlsx") == DocumentFormat.XLSX
-
-    def test_case_insensitive(self):
-        assert detect_format("file.PDF") == DocumentFormat.PDF
+class TestDetectFormat:
+    @pytest.mark.parametrize(
+        "filename,expected", _DETECT_CASES, ids=["pdf", "docx", "pptx", "xlsx", "upper-pdf"]
+    )
+    def test_detect(self, filename, expected):
+        assert detect_format(filename) == expected
 
     def test_unsupported_raises(self):
         with pytest.raises(ValueError, match="Unsupported"):
@@ -35,21 +38,36 @@ class TestDetectFormat:
             detect_format("noext")
 
 
+@pytest.fixture(scope="session")
+def small_files(tmp_path_factory) -> dict[str, Path]:
+    """Small text files keyed by their content, written once per session."""
+    root = tmp_path_factory.mktemp("hash")
+    files = {}
+    for text in ("hello world", "aaa", "bbb"):
+        path = root / f"{text.replace(' ', '_')}.txt"
+        path.write_text(text)
+        files[text] = path
+    return files
+
+
 class TestFileHash:
-    def test_hash_deterministic(self, tmp_path):
-        f = tmp_path / "test.txt"
-        f.write_text("hello world")
+    def test_hash_deterministic(self, small_files):
+        f = small_files["hello world"]
         h1 = _file_hash(f)
         h2 = _file_hash(f)
         assert h1 == h2
         assert len(h1) == 64  # SHA-256 hex
 
-    def test_different_content_different_hash(self, tmp_path):
-        f1 = tmp_path / "a.txt"
-        f1.write_text("aaa")
-        f2 = tmp_path / "b.txt"
-        f2.write_text("bbb")
-        assert _file_hash(f1) != _file_hash(f2)
+    def test_different_content_different_hash(self, small_files):
+        assert _file_hash(small_files["aaa"]) != _file_hash(small_files["bbb"])
+
+    def test_large_file_streams(self, tmp_path, monkeypatch):
+        size = 8 << 20
+        f = tmp_path / "sparse.bin"
+        with open(f, "wb") as fh:
+            fh.truncate(size)
+        monkeypatch.setattr(Path, "read_bytes", lambda self: pytest.fail("read whole file"))
+        assert _file_hash(f) == hashlib.sha256(bytes(size)).hexdigest()
 
 
 class TestExtractDocument:
@@ -60,12 +78,14 @@ class TestExtractDocument:
     def test_empty_file(self, tmp_path):
         f = tmp_path / "empty.pdf"
         f.write_bytes(b"")
-        content = extract_document(f)
+        backend = MagicMock()
+        with patch.dict(extractor_factory._EXTRACTOR_MAP, {DocumentFormat.PDF: backend}):
+            content = extract_document(f)
+        backend.assert_not_called()  # short-circuits before any format backend
         assert not content.is_valid
         assert "empty" in content.extraction_errors[0].lower()
 
-    def test_unsupported_format(self, tmp_path):
-        f = tmp_path / "file.txt"
-        f.write_text("hello")
+    def test_unsupported_format(self, small_files):
+        # Any non-empty .txt will do; reuse the session's files instead of writing one
         with pytest.raises(ValueError, match="Unsupported"):
-            extract_document(f)
+            extract_document(small_files["aaa"])
@@ -8,25 +8,37 @@ import pytest
 
 from src.config import Settings
 from src.llm.callbacks import TokenTrackingCallback
+from src.llm.factory import get_embeddings, get_llm
+
+
+@pytest.fixture(scope="module")
+def _shared_cb() -> TokenTrackingCallback:
+    return TokenTrackingCallback()
+
+
+@pytest.fixture
+def cb(_shared_cb: TokenTrackingCallback) -> TokenTrackingCallback:
+    """The module's callback, reset to a clean slate for each test."""
+    _shared_cb.reset()
+    return _shared_cb
 
 
 class TestTokenTrackingCallback:
     def test_initial_state(self):
+        # Constructs its own instance: this is the one test of __init__ itself
         cb = TokenTrackingCallback()
         assert cb.total_tokens == 0
         assert cb.total_input_tokens == 0
         assert cb.total_output_tokens == 0
         assert cb.total_calls == 0
 
-    def test_summary(self):
-        cb = TokenTrackingCallback()
+    def test_summary(self, cb: TokenTrackingCallback):
         s = cb.summary()
         assert s["total_tokens"] == 0
         assert s["total_calls"] == 0
         assert "total_latency_ms" in s
 
-    def test_reset(self):
-        cb = TokenTrackingCallback()
+    def test_reset(self, cb: TokenTrackingCallback):
         cb.total_input_tokens = 100
         cb.total_output_tokens = 50
         cb.total_calls = 3
@@ -35,19 +47,19 @@ class TestTokenTrackingCallback:
         assert cb.total_calls == 0
 
 
-class TestLLMFactory:
-    """Test that the factory raises for unknown providers (without needing real API keys)."""
-
-    def test_unsupported_llm_provider(self):
-        from src.llm.factory import get_llm
+@pytest.fixture(scope="module")
+def unsupported_settings() -> Settings:
+    # model_construct fills field defaults but skips env loading and validation
+    return Settings.model_construct(
+        llm_provider="unsupported_provider",
+        embedding_provider="unsupported_provider",
+    )
 
-        settings = Settings(llm_provider="unsupported_provider")
-        with pytest.raises(ValueError, match="Unsupported"):
-            get_llm(settings)
 
-    def test_unsupported_embedding_provider(self):
-        from src.llm.factory import get_embeddings
+class TestLLMFactory:
+    """Test that the factory raises for unknown providers (without needing real API keys)."""
 
-        settings = Settings(embedding_provider="unsupported_provider")
+    @pytest.mark.parametrize("getter", [get_llm, get_embeddings], ids=["llm", "embeddings"])
+    def test_unsupported_provider(self, unsupported_settings: Settings, getter):
         with pytest.raises(ValueError, match="Unsupported"):
-            get_embeddings(settings)
+            getter(unsupported_settings)
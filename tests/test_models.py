@@ -11,7 +11,7 @@ from src.models.document import (
     PageContent,
     Section,
 )
-from src.models.chunk import Chunk
+from src.models.chunk import Chunk, ChunkMeta
 from src.models.dqc import (
     DQCChecklist,
     DQCEvaluationResult,
@@ -74,7 +74,8 @@ class TestDocumentMetadata:
 
 class TestExtractedContent:
     def test_auto_fields(self):
-        ec = ExtractedContent(filename="test.pdf", format=DocumentFormat.PDF)
+        # model_construct still runs default factories; nothing here needs validation
+        ec = ExtractedContent.model_construct(filename="test.pdf", format=DocumentFormat.PDF)
         assert ec.doc_id  # auto-generated
         assert ec.upload_timestamp
         assert ec.file_hash == ""
@@ -99,14 +100,14 @@ class TestChunk:
         assert c.doc_id == "abc"
 
     def test_to_vectorstore_metadata(self):
-        c = Chunk(
+        c = Chunk.model_construct(
             doc_id="d1",
             text="sample",
             section_name="Intro",
             page_number=3,
             chunk_index=0,
             token_count=10,
-            metadata={"filename": "test.pdf"},
+            metadata=ChunkMeta(filename="test.pdf"),
         )
         meta = c.to_vectorstore_metadata()
         assert meta["doc_id"] == "d1"
@@ -115,6 +116,25 @@ class TestChunk:
         assert meta["chunk_index"] == 0
         assert meta["token_count"] == 10
         assert meta["filename"] == "test.pdf"
+        assert meta["format"] == ""
+
+    def test_metadata_is_typed(self):
+        c = Chunk(doc_id="d1", text="hello", metadata={"filename": "a.pdf", "format": "pdf"})
+        assert c.metadata == ChunkMeta(filename="a.pdf", format="pdf")
+        assert not hasattr(c.metadata, "__dict__")  # slots
+
+    def test_extra_metadata_kept(self):
+        c = Chunk(
+            doc_id="d1",
+            text="hello",
+            metadata={"filename": "a.xlsx", "sheet_name": "Q1", "row_count": 4},
+        )
+        assert c.metadata.filename == "a.xlsx"
+        assert c.metadata.extra == {"sheet_name": "Q1", "row_count": 4}
+        meta = c.to_vectorstore_metadata()
+        assert meta["sheet_name"] == "Q1"
+        assert meta["row_count"] == 4
+        assert meta["filename"] == "a.xlsx"
 
     def test_vectorstore_metadata_none_pages(self):
         c = Chunk(doc_id="d1", text="hello")
@@ -153,7 +173,7 @@ class TestDQCItem:
 
 class TestDQCChecklist:
     def test_with_items(self):
-        checklist = DQCChecklist(
+        checklist = DQCChecklist.model_construct(
             version="1.0",
             name="Test DQC",
             items=[
@@ -217,7 +237,7 @@ class TestComplianceSummary:
 
 class TestComplianceReport:
     def test_auto_fields(self):
-        report = ComplianceReport(
+        report = ComplianceReport.model_construct(
             document=DocumentInfo(id="d1", filename="test.pdf"),
             dqc_version="1.0",
         )
@@ -0,0 +1,91 @@
+"""Tests for the orchestration pipeline (mode selection, state tracking)."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.config import Settings
+from src.orchestration.orchestrator import Pipeline, PipelineStage, PipelineState
+
+
+def _make_pipeline(**settings_kwargs) -> Pipeline:
+    pipeline = Pipeline.__new__(Pipeline)
+    pipeline._settings = Settings(**settings_kwargs)
+    return pipeline
+
+
+class TestModeSelection:
+    def test_dual_mode_pipeline(self):
+        assert hasattr(Pipeline, "_should_use_long_context")
+        assert hasattr(Pipeline, "_run_long_context")
+        assert hasattr(Pipeline, "_run_rag")
+
+    async def test_single_stage_enum(self, monkeypatch):
+        from src.api.routers import v1
+
+        state = PipelineState()
+        assert state.stage is PipelineStage.PENDING
+        monkeypatch.setitem(v1._jobs, "job-1", state)
+        served = []
+        for stage in PipelineStage:
+            state.stage = stage
+            served.append((await v1.analysis_status("job-1")).stage)
+        # The status API reports every stage of the one enum by its value
+        assert served == [
+            "pending",
+            "ingestion",
+            "preprocessing",
+            "embedding",
+            "evaluation",
+            "aggregation",
+            "reporting",
+            "completed",
+            "failed",
+        ]
+
+    def test_rag_mode(self):
+        pipeline = _make_pipeline(evaluation_mode="rag")
+        assert pipeline._should_use_long_context("short text") is False
+
+    def test_long_context_mode(self):
+        pipeline = _make_pipeline(evaluation_mode="long_context")
+        assert pipeline._should_use_long_context("x" * 10_000_000) is True
+
+    @pytest.mark.parametrize("chars,expected", [(100, True), (1_000, False)])
+    def test_auto_mode_threshold(self, chars, expected):
+        pipeline = _make_pipeline(evaluation_mode="auto", long_context_max_tokens=100)
+        assert pipeline._should_use_long_context("x" * chars) is expected
+
+
+class TestByok:
+    def test_override_does_not_touch_shared_settings(self, tmp_path):
+        base = Settings(google_api_key="shared-key", audit_db_path=str(tmp_path / "audit.db"))
+        pipeline = Pipeline(settings=base, google_api_key_override="user-key")
+        assert pipeline._settings.google_api_key == "user-key"
+        assert base.google_api_key == "shared-key"
+
+
+class TestEmit:
+    def test_emit_without_listener_updates_state(self):
+        pipeline = Pipeline.__new__(Pipeline)
+        pipeline._on_progress = None
+        pipeline.state = PipelineState()
+        pipeline._emit(PipelineStage.EMBEDDING, 40)
+        assert pipeline.state.stage is PipelineStage.EMBEDDING
+        assert pipeline.state.progress == 40
+
+    def test_emit_notifies_listener(self):
+        seen: list[tuple[PipelineStage, float]] = []
+        pipeline = Pipeline.__new__(Pipeline)
+        pipeline._on_progress = lambda s: seen.append((s.stage, s.progress))
+        pipeline.state = PipelineState()
+        pipeline._emit(PipelineStage.REPORTING, 90)
+        assert seen == [(PipelineStage.REPORTING, 90)]
+
+
+class TestPipelineState:
+    def test_stage_times_dict(self):
+        state = PipelineState()
+        state.stage_times.append((PipelineStage.INGESTION, 1.5))
+        state.stage_times.append((PipelineStage.EVALUATION, 2.0))
+        assert state.stage_times_dict() == {"ingestion": 1.5, "evaluation": 2.0}
@@ -0,0 +1,85 @@
+"""Tests for the JSON and PDF report writers."""
+
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+
+from src.models.dqc import DQCEvaluationResult, DQCStatus, RiskLevel
+from src.models.report import (
+    AuditInfo,
+    ComplianceReport,
+    ComplianceSummary,
+    DocumentInfo,
+    RiskDistribution,
+)
+from src.reporting.json_reporter import save_json_report
+from src.reporting.pdf_reporter import _findings_table, generate_pdf_report
+
+
+def _report(n_findings: int) -> ComplianceReport:
+    return ComplianceReport(
+        document=DocumentInfo(id="doc-123", filename="test.pdf", pages=10),
+        dqc_version="1.0",
+        overall_compliance=ComplianceSummary(
+            score=50.0,
+            total_items=n_findings,
+            passed=n_findings // 2,
+            failed=n_findings - n_findings // 2,
+            partial=0,
+            risk_distribution=RiskDistribution(high=n_findings - n_findings // 2),
+        ),
+        executive_summary="Summary.",
+        findings=[
+            DQCEvaluationResult(
+                dqc_item_id=f"DQC-{i:03d}",
+                status=DQCStatus.PASS if i % 2 else DQCStatus.FAIL,
+                justification=f"Justification for item {i}. " * 5,
+                risk_level=RiskLevel.LOW if i % 2 else RiskLevel.HIGH,
+                confidence_score=0.8,
+                recommendation="" if i % 2 else f"Fix item {i}.",
+            )
+            for i in range(n_findings)
+        ],
+        audit=AuditInfo(
+            model_version="gemini-2.5-flash",
+            embedding_model="gemini-embedding-001",
+            prompt_version="v1.0",
+            dqc_version="1.0",
+        ),
+    )
+
+
+class TestJsonReport:
+    def test_round_trip(self, tmp_path):
+        report = _report(3)
+        path = save_json_report(report, tmp_path)
+        raw = path.read_bytes()
+        data = json.loads(raw)
+        assert data["report_id"] == report.report_id
+        assert [f["dqc_item_id"] for f in data["findings"]] == ["DQC-000", "DQC-001", "DQC-002"]
+        # Validate straight from the bytes (pydantic-core parser, no dict round-trip)
+        assert ComplianceReport.model_validate_json(raw) == report
+
+
+class TestPdfReport:
+    def test_findings_table_has_header_and_one_row_per_finding(self):
+        from reportlab.lib.styles import getSampleStyleSheet
+
+        table = _findings_table(_report(4), getSampleStyleSheet()["BodyText"])
+        assert len(table._cellvalues) == 5
+        assert table.repeatRows == 1
+
+    @pytest.mark.parametrize("n_findings", [0, 1, 200])
+    def test_generates_pdf(self, tmp_path, n_findings):
+        path = generate_pdf_report(_report(n_findings), tmp_path)
+        assert path.exists()
+        assert path.read_bytes().startswith(b"%PDF")
+
+    def test_finding_longer_than_a_page_splits(self, tmp_path):
+        report = _report(3)
+        report.findings[0].justification = "word " * 6000
+        path = generate_pdf_report(report, tmp_path)
+        assert len(re.findall(rb"/Type /Page\b", path.read_bytes())) > 2
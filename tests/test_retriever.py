@@ -5,10 +5,20 @@ from __future__ import annotations
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from langchain_core.documents import Document as LCDocument
 
-from src.retrieval.retriever import RetrievalEngine, RetrievalResult
+from src.retrieval import retriever
+from src.retrieval.retriever import (
+    RetrievalEngine,
+    RetrievalResult,
+    _assemble_context,
+    _DocVectors,
+)
+
+# One chunk with no metadata, shared read-only by the fallback-label tests
+_BARE_DOCS = [LCDocument(page_content="text", metadata={})]
 
 
 class TestRetrievalResult:
@@ -39,32 +49,121 @@ class TestRetrievalResult:
         assert "---" in ctx  # separator
 
     def test_context_text_missing_metadata(self):
-        docs = [LCDocument(page_content="text", metadata={})]
-        r = RetrievalResult(query="q", chunks=docs)
+        r = RetrievalResult(query="q", chunks=_BARE_DOCS)
         ctx = r.context_text
         assert "Unknown Section" in ctx
 
 
-class TestRetrievalEngine:
-    def test_group_by_section_orders_within_section(self):
-        engine = RetrievalEngine.__new__(RetrievalEngine)
+class TestAssembleContext:
+    def test_text_and_tokens_in_one_pass(self):
         docs = [
-            LCDocument(page_content="c", metadata={"section_name": "A", "page_number": 3, "chunk_index": 1}),
-            LCDocument(page_content="a", metadata={"section_name": "A", "page_number": 1, "chunk_index": 0}),
-            LCDocument(page_content="b", metadata={"section_name": "A", "page_number": 2, "chunk_index": 0}),
+            LCDocument(
+                page_content="one two three",
+                metadata={"section_name": "A", "page_number": 1},
+            ),
+            LCDocument(
+                page_content="four",
+                metadata={"section_name": "B", "page_number": 2, "token_count": 7},
+            ),
         ]
-        ordered = engine._group_by_section(docs)
-        pages = [d.metadata["page_number"] for d in ordered]
-        assert pages == [1, 2, 3]
+        text, tokens = _assemble_context(docs)
+        assert text == RetrievalResult(query="q", chunks=docs).context_text
+        assert tokens == 3 + 7
 
-    def test_group_by_section_separates_sections(self):
-        engine = RetrievalEngine.__new__(RetrievalEngine)
+    def test_large_input(self):
+        n = 5000
         docs = [
-            LCDocument(page_content="b1", metadata={"section_name": "B", "page_number": 5, "chunk_index": 0}),
-            LCDocument(page_content="a1", metadata={"section_name": "A", "page_number": 1, "chunk_index": 0}),
+            LCDocument.model_construct(
+                page_content=f"chunk {i}", metadata={"section_name": "S", "page_number": i}
+            )
+            for i in range(n)
         ]
-        ordered = engine._group_by_section(docs)
+        text, tokens = _assemble_context(docs)
+        assert text.count("\n\n---\n\n") == n - 1
+        assert text.endswith(f"[Section: S | Page: {n - 1}]\nchunk {n - 1}")
+        assert tokens == 2 * n
+
+    def test_context_assembled_once(self):
+        with patch(
+            "src.retrieval.retriever._assemble_context", wraps=_assemble_context
+        ) as assemble:
+            r = RetrievalResult(query="q", chunks=_BARE_DOCS)
+            assert r.context_text is r.context_text
+        assert assemble.call_count == 1
+
+    def test_precomputed_context_kept(self):
+        r = RetrievalResult(query="q", chunks=_BARE_DOCS, context_text="given")
+        assert r.context_text == "given"
+
+
+class TestDocVectors:
+    def test_quantized_distances_scored_in_blocks(self, monkeypatch):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(10, 16)).astype(np.float32)
+        queries = vectors[[2, 7]] + 0.01
+        exact = _DocVectors.build([], vectors, quantize=False).distances(queries)
+        quantized = _DocVectors.build([], vectors, quantize=True)
+        whole = quantized.distances(queries)
+
+        monkeypatch.setattr(retriever, "_DEQUANT_BLOCK_ROWS", 3)  # blocks of 3, 3, 3, 1
+        blocked = quantized.distances(queries)
+
+        np.testing.assert_allclose(blocked, whole, rtol=1e-5)
+        np.testing.assert_allclose(blocked, exact, rtol=0.05, atol=0.1)
+        assert blocked.argmin(axis=1).tolist() == [2, 7]
+
+
+# Shared read-only inputs: _group_by_section returns a new list and never
+# reorders the one it is given
+_SAME_SECTION_DOCS = [
+    LCDocument.model_construct(
+        page_content="c", metadata={"section_name": "A", "page_number": 3, "chunk_index": 1}
+    ),
+    LCDocument.model_construct(
+        page_content="a", metadata={"section_name": "A", "page_number": 1, "chunk_index": 0}
+    ),
+    LCDocument.model_construct(
+        page_content="b", metadata={"section_name": "A", "page_number": 2, "chunk_index": 0}
+    ),
+]
+_TWO_SECTION_DOCS = [
+    LCDocument.model_construct(
+        page_content="b1", metadata={"section_name": "B", "page_number": 5, "chunk_index": 0}
+    ),
+    LCDocument.model_construct(
+        page_content="a1", metadata={"section_name": "A", "page_number": 1, "chunk_index": 0}
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def engine() -> RetrievalEngine:
+    # _group_by_section touches no instance state, so skip __init__ (and the vector store)
+    return RetrievalEngine.__new__(RetrievalEngine)
+
+
+class TestRetrievalEngine:
+    def test_group_by_section_orders_within_section(self, engine: RetrievalEngine):
+        ordered = engine._group_by_section(_SAME_SECTION_DOCS)
+        pages = [d.metadata["page_number"] for d in ordered]
+        assert pages == [1, 2, 3]
+        assert [d.page_content for d in _SAME_SECTION_DOCS] == ["c", "a", "b"]  # input untouched
+
+    def test_group_by_section_separates_sections(self, engine: RetrievalEngine):
+        ordered = engine._group_by_section(_TWO_SECTION_DOCS)
         sections = [d.metadata["section_name"] for d in ordered]
         # Both sections present
         assert "A" in sections
         assert "B" in sections
+
+    def test_group_by_section_keeps_first_seen_section_order(self, engine: RetrievalEngine):
+        meta = [("B", 4, 0), ("A", 2, 0), ("B", 1, 0), ("A", 1, 1), ("A", 1, 0)]
+        docs = [
+            LCDocument.model_construct(
+                page_content=f"{s}{p}{c}",
+                metadata={"section_name": s, "page_number": p, "chunk_index": c},
+            )
+            for s, p, c in meta
+        ]
+        ordered = engine._group_by_section(docs)
+        assert [d.page_content for d in ordered] == ["B10", "B40", "A10", "A11", "A20"]
@@ -0,0 +1,44 @@
+"""Benchmarks for the retrieval hot paths (chunk ordering, context assembly).
+
+Disabled by default (each runs once as a plain test); measure with
+``pytest tests/test_retriever_bench.py -n0 --benchmark-enable``.
+"""
+
+from __future__ import annotations
+
+import pytest
+from langchain_core.documents import Document as LCDocument
+
+from src.retrieval.retriever import RetrievalEngine, _assemble_context
+
+pytestmark = pytest.mark.benchmark(group="retriever")
+
+_N_DOCS = 10_000
+
+
+@pytest.fixture(scope="module")
+def docs() -> list[LCDocument]:
+    return [
+        LCDocument.model_construct(
+            page_content=f"chunk {i} text",
+            metadata={
+                "section_name": f"S{i % 20}",
+                "page_number": i % 100,
+                "chunk_index": i,
+                "token_count": 3,
+            },
+        )
+        for i in range(_N_DOCS)
+    ]
+
+
+def test_group_by_section(benchmark, docs):
+    engine = RetrievalEngine.__new__(RetrievalEngine)
+    ordered = benchmark(engine._group_by_section, docs)
+    assert len(ordered) == _N_DOCS
+
+
+def test_assemble_context(benchmark, docs):
+    text, tokens = benchmark(_assemble_context, docs)
+    assert tokens == 3 * _N_DOCS
+    assert text.count("\n\n---\n\n") == _N_DOCS - 1
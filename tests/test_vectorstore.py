@@ -0,0 +1,234 @@
+"""Tests for the Chroma vector store wrapper (fake embeddings, temp persist dir)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.config import Settings
+from src.models.chunk import Chunk
+from src.retrieval.retriever import RetrievalEngine
+from src.vectorstore import chroma_store
+from src.vectorstore.chroma_store import VectorStore, get_vector_store
+
+# Chroma's default L2 distance over random fake vectors can fall outside
+# LangChain's 0–1 relevance range; the warning is irrelevant here
+pytestmark = pytest.mark.filterwarnings("ignore:Relevance scores must be between")
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """Unit-norm fake embeddings that record how many texts each call received."""
+
+    calls: list[int] = []
+
+    def _get_embedding(self, seed: int) -> list[float]:
+        vec = np.random.default_rng(seed).normal(size=self.size)
+        return list(vec / np.linalg.norm(vec))
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(len(texts))
+        return super().embed_documents(texts)
+
+
+@pytest.fixture
+def embeddings() -> CountingEmbeddings:
+    return CountingEmbeddings(size=16, calls=[])
+
+
+@pytest.fixture
+def store(tmp_path, embeddings) -> VectorStore:
+    settings = Settings(
+        chroma_persist_dir=str(tmp_path / "vectordb"),
+        chroma_collection_name="test_chunks",
+        retrieval_score_threshold=0.0,
+    )
+    return VectorStore(settings=settings, embeddings=embeddings)
+
+
+def _chunks(doc_id: str, n: int) -> list[Chunk]:
+    return [
+        Chunk(
+            doc_id=doc_id,
+            text=f"Chunk {i} of {doc_id}",
+            section_name=f"S{i % 3}",
+            page_number=i + 1,
+            chunk_index=i,
+            token_count=5,
+            metadata={"filename": f"{doc_id}.pdf", "format": "pdf"},
+        )
+        for i in range(n)
+    ]
+
+
+class TestAddChunks:
+    def test_empty(self, store: VectorStore):
+        assert store.add_chunks([]) == []
+
+    def test_single_embedding_call(self, store: VectorStore, embeddings: CountingEmbeddings):
+        chunks = _chunks("doc-a", 25)
+        ids = store.add_chunks(chunks)
+        assert ids == [c.chunk_id for c in chunks]
+        assert embeddings.calls == [25]
+        assert store.collection_count == 25
+
+    def test_embedding_batch_size(self, store: VectorStore, embeddings: CountingEmbeddings):
+        store.add_chunks(_chunks("doc-a", 25), batch_size=10)
+        assert embeddings.calls == [10, 10, 5]
+
+    def test_metadata_stored(self, store: VectorStore):
+        store.add_chunks(_chunks("doc-a", 3))
+        results = store.similarity_search("Chunk 1 of doc-a", k=3, doc_id="doc-a")
+        assert results
+        meta = results[0][0].metadata
+        assert meta["doc_id"] == "doc-a"
+        assert meta["filename"] == "doc-a.pdf"
+
+
+class TestAsyncAddChunks:
+    async def test_empty(self, store: VectorStore):
+        assert await store.aadd_chunks([]) == []
+
+    async def test_matches_sync(self, store: VectorStore, embeddings: CountingEmbeddings):
+        chunks = _chunks("doc-a", 25)
+        ids = await store.aadd_chunks(chunks, batch_size=10)
+        assert ids == [c.chunk_id for c in chunks]
+        # aembed_documents delegates to embed_documents via a thread by default
+        assert sorted(embeddings.calls) == [5, 10, 10]
+        assert store.collection_count == 25
+
+
+class TestDelete:
+    def test_delete_by_doc_id(self, store: VectorStore):
+        store.add_chunks(_chunks("doc-a", 3))
+        store.add_chunks(_chunks("doc-b", 2))
+        store.delete_by_doc_id("doc-a")
+        assert store.collection_count == 2
+
+    def test_shared_collection_never_lists_collections(self, store: VectorStore, monkeypatch):
+        store.add_chunks(_chunks("doc-a", 3))
+        monkeypatch.setattr(
+            store._store._client, "list_collections", lambda: pytest.fail("listed collections")
+        )
+        assert store.collection_count == 3
+        store.reset_collection()
+        assert store.collection_count == 0
+
+
+class TestGetVectorStore:
+    def test_cached(self, monkeypatch, embeddings: CountingEmbeddings, tmp_path):
+        settings = Settings(chroma_persist_dir=str(tmp_path / "vectordb"))
+        monkeypatch.setattr(chroma_store, "get_settings", lambda: settings)
+        monkeypatch.setattr(chroma_store, "get_embeddings", lambda _s: embeddings)
+        get_vector_store.cache_clear()
+        try:
+            assert get_vector_store() is get_vector_store()
+        finally:
+            get_vector_store.cache_clear()
+
+
+class TestRetrieveBatch:
+    @pytest.fixture
+    def engine(self, store: VectorStore) -> RetrievalEngine:
+        engine = RetrievalEngine(store)
+        engine._settings = store._settings
+        return engine
+
+    def test_matches_single_query_ranking(self, store: VectorStore, engine: RetrievalEngine):
+        store.add_chunks(_chunks("doc-a", 12))
+        store.add_chunks(_chunks("doc-b", 4))
+        queries = ["Chunk 3 of doc-a", "Chunk 7 of doc-a", "unrelated"]
+
+        batch = engine.retrieve_batch(queries, doc_id="doc-a", k=4)
+
+        assert [r.query for r in batch] == queries
+        for query, result in zip(queries, batch):
+            single = store.similarity_search(query, k=4, doc_id="doc-a")
+            assert {d.id for d in result.chunks} == {d.id for d, _ in single}
+            assert all(d.metadata["doc_id"] == "doc-a" for d in result.chunks)
+
+    def test_exact_match_scores_highest(self, store: VectorStore, engine: RetrievalEngine):
+        store.add_chunks(_chunks("doc-a", 5))
+        (result,) = engine.retrieve_batch(["Chunk 2 of doc-a"], doc_id="doc-a", k=3)
+        assert max(result.scores) == pytest.approx(1.0, abs=1e-5)
+
+    def test_unknown_doc(self, engine: RetrievalEngine):
+        results = engine.retrieve_batch(["q1", "q2"], doc_id="missing")
+        assert [r.chunks for r in results] == [[], []]
+
+    def test_int8_matches_float_ranking(self, store: VectorStore, engine: RetrievalEngine):
+        store.add_chunks(_chunks("doc-a", 20))
+        queries = ["Chunk 4 of doc-a", "Chunk 11 of doc-a"]
+        exact = engine.retrieve_batch(queries, doc_id="doc-a", k=1)
+
+        engine._settings = store._settings.model_copy(update={"retrieval_quantize_int8": True})
+        engine.invalidate()
+        quantized = engine.retrieve_batch(queries, doc_id="doc-a", k=1)
+
+        assert engine._doc_vectors["doc-a"].vectors.dtype == np.int8
+        assert [r.chunks[0].id for r in quantized] == [r.chunks[0].id for r in exact]
+        for q, e in zip(quantized, exact):
+            assert q.scores[0] == pytest.approx(e.scores[0], abs=0.05)
+
+
+class TestPerDocCollections:
+    @pytest.fixture
+    def store(self, tmp_path, embeddings) -> VectorStore:
+        settings = Settings(
+            chroma_persist_dir=str(tmp_path / "vectordb"),
+            chroma_collection_name="test_chunks",
+            chroma_collection_per_doc=True,
+            retrieval_score_threshold=0.0,
+        )
+        return VectorStore(settings=settings, embeddings=embeddings)
+
+    def test_chunks_routed_by_doc(self, store: VectorStore):
+        store.add_chunks(_chunks("doc-a", 3) + _chunks("doc-b", 2))
+        assert store._store_for("doc-a")._collection.count() == 3
+        assert store._store_for("doc-b")._collection.count() == 2
+        assert store._store._collection.count() == 0
+        assert store.collection_count == 5
+
+    def test_search_scoped_without_filter(self, store: VectorStore):
+        store.add_chunks(_chunks("doc-a", 3) + _chunks("doc-b", 3))
+        results = store.similarity_search("Chunk 1 of doc-b", k=10, doc_id="doc-b")
+        assert results[0][0].page_content == "Chunk 1 of doc-b"
+        assert {doc.metadata["doc_id"] for doc, _ in results} == {"doc-b"}
+        docs, vectors = store.get_doc_vectors("doc-b")
+        assert len(docs) == 3 and vectors.shape == (3, 16)
+
+    def test_delete_drops_collection(self, store: VectorStore):
+        store.add_chunks(_chunks("doc-a", 3) + _chunks("doc-b", 2))
+        store.delete_by_doc_id("doc-a")
+        assert store._per_doc_collection_names() == ["test_chunks__doc-b"]
+        assert store.collection_count == 2
+        # Deleting an unknown document is a no-op
+        store.delete_by_doc_id("missing")
+
+    def test_collection_names_listed_as_strings(self, store: VectorStore, monkeypatch):
+        # chromadb 0.6.x returns names rather than Collection objects
+        names = ["other", "test_chunks__doc-a", "test_chunks"]
+        monkeypatch.setattr(store._store._client, "list_collections", lambda: names)
+        assert store._per_doc_collection_names() == ["test_chunks__doc-a"]
+
+    def test_search_without_doc_id_spans_all_documents(self, store: VectorStore):
+        store.add_chunks(_chunks("doc-a", 3) + _chunks("doc-b", 3))
+        for doc_id in ("doc-a", "doc-b"):
+            results = store.similarity_search(f"Chunk 1 of {doc_id}", k=2)
+            assert 0 < len(results) <= 2
+            assert results[0][0].page_content == f"Chunk 1 of {doc_id}"
+            scores = [score for _, score in results]
+            assert scores == sorted(scores, reverse=True)
+
+    def test_reads_of_unknown_doc_create_nothing(self, store: VectorStore):
+        store.add_chunks(_chunks("doc-a", 2))
+        assert store.similarity_search("anything", doc_id="missing") == []
+        docs, vectors = store.get_doc_vectors("missing")
+        assert docs == [] and vectors.size == 0
+        with pytest.raises(ValueError, match="missing"):
+            store.as_retriever(doc_id="missing")
+        assert store._per_doc_collection_names() == ["test_chunks__doc-a"]
+
+    def test_as_retriever_requires_doc_id(self, store: VectorStore):
+        with pytest.raises(ValueError, match="doc_id"):
+            store.as_retriever()